@@ -46,7 +46,7 @@ class TestAudioToTranscription:
         with patch.object(transcription_service, 'start_server', return_value=True):
             with patch.object(transcription_service, 'connect_websocket', return_value=True):
                 with patch.object(transcription_service, 'send_audio_chunk') as mock_send:
-                    with patch('whisper_transcriber.audio_capture.sd.InputStream'):
+                    with patch('whisper_transcriber.audio_capture.sd.RawInputStream'):
                         # Start recording
                         assert audio_capture.start_recording(
                             transcription_service.send_audio_chunk
@@ -54,8 +54,8 @@ class TestAudioToTranscription:
                         
                         # Simulate audio callback
                         test_audio = np.array([[1000], [2000], [3000]], dtype=np.int16)
-                        audio_capture._audio_callback(
-                            test_audio, 
+                        audio_capture._raw_audio_callback(
+                            test_audio.tobytes(), 
                             frames=3, 
                             time=None, 
                             status=None
@@ -64,7 +64,7 @@ class TestAudioToTranscription:
                         # Verify audio was sent
                         mock_send.assert_called_once()
                         audio_bytes = mock_send.call_args[0][0]
-                        assert isinstance(audio_bytes, bytes)
+                        assert isinstance(audio_bytes, (bytes, memoryview))
                         assert len(audio_bytes) == 6  # 3 samples * 2 bytes
                         
                         # Stop recording
@@ -84,14 +84,14 @@ class TestAudioToTranscription:
         
         transcription_service.send_audio_chunk = mock_send
         
-        with patch('whisper_transcriber.audio_capture.sd.InputStream'):
+        with patch('whisper_transcriber.audio_capture.sd.RawInputStream'):
             audio_capture.start_recording(mock_send)
             
             # Send multiple chunks
             for i in range(5):
                 test_audio = np.full((1024, 1), i * 100, dtype=np.int16)
-                audio_capture._audio_callback(
-                    test_audio,
+                audio_capture._raw_audio_callback(
+                    test_audio.tobytes(),
                     frames=1024,
                     time=None,
                     status=None
@@ -100,7 +100,7 @@ class TestAudioToTranscription:
             # Verify all chunks were sent
             assert len(chunks_sent) == 5
             for chunk in chunks_sent:
-                assert isinstance(chunk, bytes)
+                assert isinstance(chunk, (bytes, memoryview))
                 assert len(chunk) == 2048  # 1024 samples * 2 bytes
             
             audio_capture.stop_recording()
@@ -119,14 +119,14 @@ class TestAudioToTranscription:
             if call_count == 2:
                 raise Exception("Simulated error")
         
-        with patch('whisper_transcriber.audio_capture.sd.InputStream'):
+        with patch('whisper_transcriber.audio_capture.sd.RawInputStream'):
             audio_capture.start_recording(failing_callback)
             
             # Send chunks - one should fail
             for i in range(3):
                 test_audio = np.array([[i * 100]], dtype=np.int16)
-                audio_capture._audio_callback(
-                    test_audio,
+                audio_capture._raw_audio_callback(
+                    test_audio.tobytes(),
                     frames=1,
                     time=None,
                     status=None
@@ -195,7 +195,7 @@ class TestAudioToTranscription:
                 chunks_received.append(chunk)
                 time.sleep(0.01)  # Simulate processing delay
         
-        with patch('whisper_transcriber.audio_capture.sd.InputStream'):
+        with patch('whisper_transcriber.audio_capture.sd.RawInputStream'):
             audio_capture.start_recording(thread_safe_send)
             
             # Start multiple threads sending audio
@@ -204,8 +204,8 @@ class TestAudioToTranscription:
             def send_audio_batch(thread_id):
                 for i in range(5):
                     test_audio = np.array([[thread_id * 1000 + i]], dtype=np.int16)
-                    audio_capture._audio_callback(
-                        test_audio,
+                    audio_capture._raw_audio_callback(
+                        test_audio.tobytes(),
                         frames=1,
                         time=None,
                         status=None
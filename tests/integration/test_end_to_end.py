@@ -55,8 +55,9 @@ class TestEndToEnd:
         transcription_mock.connect_websocket.return_value = True
         audio_mock.start_recording.return_value = True
         
-        # Create app
+        # Create app and let the background server warmup finish
         app = WhisperTranscriberApp()
+        app._server_warmup.join(timeout=5)
         
         # Simulate hotkey press to start recording
         hotkey_callback = hotkey_mock.register_hotkey.call_args[0][1]
@@ -114,6 +115,7 @@ class TestEndToEnd:
         
         # Create app
         app = WhisperTranscriberApp()
+        app._server_warmup.join(timeout=5)
         
         # Run multiple sessions
         for session in range(3):
@@ -172,6 +174,7 @@ class TestEndToEnd:
         
         # Create app and start recording
         app = WhisperTranscriberApp()
+        app._server_warmup.join(timeout=5)
         app.toggle_recording(None)
         
         # Get callbacks
@@ -221,11 +224,13 @@ class TestEndToEnd:
         with patch('whisper_transcriber.main.rumps.alert'):
             # Create app
             app = WhisperTranscriberApp()
+            app._server_warmup.join(timeout=5)
             
             # Scenario 1: Server not running and start failure
             transcription_mock.is_server_running.return_value = False
             transcription_mock.start_server.return_value = False
             app.toggle_recording(None)
+            app._server_warmup.join(timeout=5)
             assert app.is_recording is False
             
             # Scenario 2: WebSocket connection failure
@@ -277,6 +282,7 @@ class TestEndToEnd:
             mock_prefs_class.assert_called_once_with(
                 app.config_manager,
                 app.audio_capture,
-                app.hotkey_manager
+                app.hotkey_manager,
+                on_save=app._on_preferences_saved
             )
             mock_prefs.show.assert_called_once()
\ No newline at end of file
@@ -23,7 +23,12 @@ class TestTranscriptionToInsertion:
     @pytest.fixture
     def text_inserter(self):
         """Create text inserter instance"""
-        return TextInserter()
+        inserter = TextInserter()
+        yield inserter
+        # Drop restores scheduled while the clipboard mocks were active
+        with inserter._clipboard_lock:
+            inserter._cancel_restore()
+        inserter.close()
     
     @pytest.mark.integration
     @patch('whisper_transcriber.text_inserter.pyperclip')
@@ -43,7 +48,7 @@ class TestTranscriptionToInsertion:
         
         def handle_transcription(text, is_final):
             if is_final:
-                text_inserter.insert_text(text, InsertMethod.CLIPBOARD)
+                text_inserter.insert_text(text, InsertMethod.CLIPBOARD).result()
                 insertions.append(text)
         
         transcription_service.transcription_callback = handle_transcription
@@ -59,9 +64,11 @@ class TestTranscriptionToInsertion:
         assert insertions[0] == "Hello world"
         assert insertions[1] == "Testing insertion"
         
-        # Verify clipboard operations
-        assert mock_pyperclip.copy.call_count == 4  # 2 insertions * (copy text + restore)
-        assert mock_controller_class.call_count == 2  # Controller created for each insertion
+        # Verify clipboard operations; the second insertion lands while the
+        # first restore is pending, so the original is restored once
+        text_inserter.flush()
+        assert mock_pyperclip.copy.call_count == 3  # 2 insertions + 1 restore
+        assert mock_controller_class.call_count == 1  # Controller reused across insertions
     
     @pytest.mark.integration
     @patch('whisper_transcriber.text_inserter.keyboard.Controller')
@@ -83,7 +90,7 @@ class TestTranscriptionToInsertion:
         
         def handle_transcription(text, is_final):
             if is_final:
-                text_inserter.insert_text(text, InsertMethod.KEYBOARD)
+                text_inserter.insert_text(text, InsertMethod.KEYBOARD).result()
         
         transcription_service.transcription_callback = handle_transcription
         
@@ -129,7 +136,7 @@ class TestTranscriptionToInsertion:
         
         def handle_transcription(text, is_final):
             if is_final:
-                text_inserter.insert_text(text, InsertMethod.AUTO)
+                text_inserter.insert_text(text, InsertMethod.AUTO).result()
         
         transcription_service.transcription_callback = handle_transcription
         
@@ -238,7 +245,7 @@ class TestTranscriptionToInsertion:
                 
                 def handle_transcription(text, is_final):
                     if is_final:
-                        text_inserter.insert_text(text, InsertMethod.CLIPBOARD)
+                        text_inserter.insert_text(text, InsertMethod.CLIPBOARD).result()
                 
                 transcription_service.transcription_callback = handle_transcription
                 
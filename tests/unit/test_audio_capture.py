@@ -90,11 +90,21 @@ class TestAudioCapture:
         assert len(devices) == 1
         assert devices[0].name == "Built-in Microphone"
     
+    def test_list_devices_cached(self, audio_capture, mock_sounddevice):
+        """Test device enumeration is cached until set_device invalidates it"""
+        audio_capture.list_devices()
+        audio_capture.get_current_device()
+        assert mock_sounddevice.query_devices.call_count == 1
+        
+        audio_capture.set_device(1)
+        assert audio_capture.get_current_device().id == 1
+        assert mock_sounddevice.query_devices.call_count == 2
+    
     def test_start_recording_success(self, audio_capture, mock_sounddevice):
         """Test successful start of recording"""
         callback = Mock()
         mock_stream = MagicMock()
-        mock_sounddevice.InputStream.return_value = mock_stream
+        mock_sounddevice.RawInputStream.return_value = mock_stream
         
         result = audio_capture.start_recording(callback)
         
@@ -104,13 +114,13 @@ class TestAudioCapture:
         assert audio_capture.stream == mock_stream
         
         # Verify stream configuration
-        mock_sounddevice.InputStream.assert_called_once_with(
+        mock_sounddevice.RawInputStream.assert_called_once_with(
             device=None,
             channels=1,
             samplerate=16000,
             blocksize=1600,
             dtype='int16',
-            callback=audio_capture._audio_callback
+            callback=audio_capture._raw_audio_callback
         )
         mock_stream.start.assert_called_once()
     
@@ -119,32 +129,41 @@ class TestAudioCapture:
         capture = AudioCapture(device_id=1)
         callback = Mock()
         mock_stream = MagicMock()
-        mock_sounddevice.InputStream.return_value = mock_stream
+        mock_sounddevice.RawInputStream.return_value = mock_stream
         
         capture.start_recording(callback)
         
-        mock_sounddevice.InputStream.assert_called_once_with(
+        mock_sounddevice.RawInputStream.assert_called_once_with(
             device=1,
             channels=1,
             samplerate=16000,
             blocksize=1600,
             dtype='int16',
-            callback=capture._audio_callback
+            callback=capture._raw_audio_callback
         )
     
     def test_start_recording_already_recording(self, audio_capture):
         """Test start recording when already recording"""
-        audio_capture.is_recording = True
+        audio_capture._recording.set()
         callback = Mock()
         
         result = audio_capture.start_recording(callback)
         
         assert result is False
     
+    def test_start_recording_stream_start_error(self, audio_capture, mock_sounddevice):
+        """Test recording state is cleared when the stream fails to start"""
+        mock_stream = MagicMock()
+        mock_stream.start.side_effect = Exception("Start failed")
+        mock_sounddevice.RawInputStream.return_value = mock_stream
+        
+        assert audio_capture.start_recording(Mock()) is False
+        assert audio_capture.is_recording is False
+    
     def test_start_recording_error(self, audio_capture, mock_sounddevice):
         """Test start recording handles errors gracefully"""
         callback = Mock()
-        mock_sounddevice.InputStream.side_effect = Exception("Device error")
+        mock_sounddevice.RawInputStream.side_effect = Exception("Device error")
         
         result = audio_capture.start_recording(callback)
         
@@ -157,7 +176,7 @@ class TestAudioCapture:
         # Setup recording state
         mock_stream = MagicMock()
         audio_capture.stream = mock_stream
-        audio_capture.is_recording = True
+        audio_capture._recording.set()
         audio_capture.audio_callback = Mock()
         
         audio_capture.stop_recording()
@@ -178,28 +197,66 @@ class TestAudioCapture:
         # Setup
         user_callback = Mock()
         audio_capture.audio_callback = user_callback
-        audio_capture.is_recording = True
+        audio_capture._recording.set()
         
         # Create test audio data
         test_data = np.array([[1000], [2000], [3000]], dtype=np.int16)
         
         # Call the internal callback
-        audio_capture._audio_callback(test_data, frames=3, time=None, status=None)
+        audio_capture._raw_audio_callback(test_data.tobytes(), frames=3, time=None, status=None)
         
-        # Verify callback was called with byte data
+        # Verify callback was called with a zero-copy byte view
         user_callback.assert_called_once()
         call_args = user_callback.call_args[0][0]
-        assert isinstance(call_args, bytes)
+        assert isinstance(call_args, memoryview)
         assert len(call_args) == 6  # 3 samples * 2 bytes per int16
+        assert bytes(call_args) == test_data.tobytes()
+    
+    def test_audio_callback_batching(self, audio_capture):
+        """Test audio callback coalesces chunks when batching is enabled"""
+        user_callback = Mock()
+        audio_capture.audio_callback = user_callback
+        audio_capture._recording.set()
+        audio_capture._batch_target_bytes = 8  # Two 2-sample chunks
+        
+        test_data = np.array([[1000], [2000]], dtype=np.int16)
+        audio_capture._raw_audio_callback(test_data.tobytes(), frames=2, time=None, status=None)
+        user_callback.assert_not_called()
+        
+        audio_capture._raw_audio_callback(test_data.tobytes(), frames=2, time=None, status=None)
+        user_callback.assert_called_once()
+        assert user_callback.call_args[0][0] == test_data.tobytes() * 2
+        
+        # Residual data is flushed when recording stops
+        audio_capture._raw_audio_callback(test_data.tobytes(), frames=2, time=None, status=None)
+        audio_capture.stop_recording()
+        assert user_callback.call_count == 2
+        assert user_callback.call_args[0][0] == test_data.tobytes()
+    
+    def test_audio_callback_amplitude_log(self, audio_capture, caplog):
+        """Test amplitude is only computed when debug logging is enabled"""
+        audio_capture.audio_callback = Mock()
+        audio_capture._recording.set()
+        test_data = np.array([[1000], [-3000]], dtype=np.int16)
+        
+        with caplog.at_level(logging.INFO, logger="whisper_transcriber.audio_capture"):
+            audio_capture._raw_audio_callback(test_data.tobytes(), frames=2, time=None, status=None)
+        assert "max amplitude" not in caplog.text
+        assert audio_capture._abs_scratch is None
+        
+        audio_capture._audio_log_counter = 0
+        with caplog.at_level(logging.DEBUG, logger="whisper_transcriber.audio_capture"):
+            audio_capture._raw_audio_callback(test_data.tobytes(), frames=2, time=None, status=None)
+        assert "max amplitude: 3000" in caplog.text
     
     def test_audio_callback_not_recording(self, audio_capture):
         """Test audio callback does nothing when not recording"""
         user_callback = Mock()
         audio_capture.audio_callback = user_callback
-        audio_capture.is_recording = False
+        audio_capture._recording.clear()
         
         test_data = np.array([[1000]], dtype=np.int16)
-        audio_capture._audio_callback(test_data, frames=1, time=None, status=None)
+        audio_capture._raw_audio_callback(test_data.tobytes(), frames=1, time=None, status=None)
         
         user_callback.assert_not_called()
     
@@ -207,7 +264,7 @@ class TestAudioCapture:
         """Test audio callback handles status errors"""
         user_callback = Mock()
         audio_capture.audio_callback = user_callback
-        audio_capture.is_recording = True
+        audio_capture._recording.set()
         
         test_data = np.array([[1000]], dtype=np.int16)
         # Create a mock status object that evaluates to True and has string representation
@@ -216,7 +273,7 @@ class TestAudioCapture:
         status.__str__.return_value = "Buffer overflow"
         
         with caplog.at_level(logging.WARNING):
-            audio_capture._audio_callback(test_data, frames=1, time=None, status=status)
+            audio_capture._raw_audio_callback(test_data.tobytes(), frames=1, time=None, status=status)
         
         # Should still process data despite status error
         user_callback.assert_called_once()
@@ -252,7 +309,7 @@ class TestAudioCapture:
     
     def test_set_device_while_recording(self, audio_capture):
         """Test setting device while recording fails"""
-        audio_capture.is_recording = True
+        audio_capture._recording.set()
         
         with pytest.raises(RuntimeError, match="Cannot change device while recording"):
             audio_capture.set_device(1)
@@ -271,7 +328,7 @@ class TestAudioCapture:
         """Test thread safety of start/stop operations"""
         callback = Mock()
         mock_stream = MagicMock()
-        mock_sounddevice.InputStream.return_value = mock_stream
+        mock_sounddevice.RawInputStream.return_value = mock_stream
         
         def start_recording():
             audio_capture.start_recording(callback)
@@ -24,7 +24,9 @@ class TestConfigManager:
     @pytest.fixture
     def config_manager(self, temp_config_file):
         """Create a ConfigManager instance with temp config file"""
-        return ConfigManager(config_path=temp_config_file)
+        manager = ConfigManager(config_path=temp_config_file)
+        yield manager
+        manager.flush()
 
     def test_init_loads_existing_config(self, temp_config_file):
         """Test that ConfigManager loads existing configuration on init"""
@@ -97,10 +99,37 @@ class TestConfigManager:
         config_manager.set("level1.level2.value", "nested")
         assert config_manager.config["level1"]["level2"]["value"] == "nested"
 
+    def test_get_nested_keys_reflect_updates(self, config_manager):
+        """Test nested get() sees values changed via set(), merge() and reset()"""
+        config_manager.set("level1.level2.value", "nested")
+        assert config_manager.get("level1.level2.value") == "nested"
+        
+        config_manager.merge({"level1": {"other": 1}})
+        assert config_manager.get("level1.other") == 1
+        assert config_manager.get("level1.level2.value") is None
+        
+        config_manager.set("level1", "flat")
+        assert config_manager.get("level1.other", "default") == "default"
+        
+        config_manager.reset()
+        assert config_manager.get("level1.other") is None
+
+    def test_get_nested_keys_reflect_in_place_changes(self, config_manager):
+        """Test nested get() sees changes made directly to the config dict"""
+        config_manager.set("level1.level2.value", "nested")
+        assert config_manager.get("level1.level2.value") == "nested"
+        
+        config_manager.config["level1"]["level2"]["value"] = "changed"
+        assert config_manager.get("level1.level2.value") == "changed"
+        
+        del config_manager.config["level1"]
+        assert config_manager.get("level1.level2.value") is None
+
     def test_save_writes_config_to_file(self, config_manager, temp_config_file):
         """Test save() persists configuration to disk"""
         config_manager.config = {"saved_key": "saved_value"}
         config_manager.save()
+        config_manager.flush()
         
         # Read file and verify
         with open(temp_config_file, 'r') as f:
@@ -118,8 +147,39 @@ class TestConfigManager:
             config_path.parent.rmdir()
             
             manager.save()
+            manager.flush()
             assert config_path.exists()
 
+    def test_save_is_debounced_and_atomic(self, config_manager, temp_config_file):
+        """Test save() coalesces writes and replaces the file atomically"""
+        config_manager.config = {"key": "first"}
+        config_manager.save()
+        config_manager.config = {"key": "second"}
+        config_manager.save()
+        
+        # Nothing written until the debounce delay elapses
+        with open(temp_config_file, 'r') as f:
+            assert json.load(f) == {"test_key": "test_value"}
+        
+        config_manager._save_timer.join(timeout=2)
+        with open(temp_config_file, 'r') as f:
+            assert json.load(f) == {"key": "second"}
+        assert not config_manager._temp_path.exists()
+
+    def test_load_falls_back_to_temp_file(self, temp_config_file):
+        """Test corrupted config is recovered from a leftover temp file"""
+        with open(temp_config_file, 'w') as f:
+            f.write("invalid json{")
+        temp_path = Path(temp_config_file).with_suffix(".json.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump({"recovered": True}, f)
+        
+        try:
+            manager = ConfigManager(config_path=temp_config_file)
+            assert manager.config == {"recovered": True}
+        finally:
+            os.unlink(temp_path)
+
     def test_default_config_contains_required_keys(self):
         """Test that default config contains all required keys"""
         manager = ConfigManager(config_path="dummy_path")
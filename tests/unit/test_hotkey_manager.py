@@ -60,6 +60,20 @@ class TestHotkeyManager:
         
         assert "cmd+shift+r" not in hotkey_manager.hotkeys
     
+    def test_unregister_hotkey_keeps_alias(self, hotkey_manager):
+        """Test unregistering one spelling keeps an alias for the same keys"""
+        alias_callback = Mock()
+        hotkey_manager.register_hotkey("cmd+a", Mock())
+        hotkey_manager.register_hotkey("command+a", alias_callback)
+        
+        hotkey_manager.unregister_hotkey("cmd+a")
+        
+        hotkey_manager._pynput_map["<cmd>+a"]()
+        alias_callback.assert_called_once()
+        
+        hotkey_manager.unregister_hotkey("command+a")
+        assert hotkey_manager._pynput_map == {}
+    
     def test_unregister_hotkey_not_found(self, hotkey_manager):
         """Test unregistering non-existent hotkey"""
         # Should not raise error
@@ -141,6 +155,22 @@ class TestHotkeyManager:
         assert hotkey_manager._parse_hotkey("CMD+SHIFT+R") == "<cmd>+<shift>+r"
         assert hotkey_manager._parse_hotkey("Ctrl+Alt+Delete") == "<ctrl>+<alt>+<delete>"
     
+    def test_parse_hotkey_strips_spaces(self, hotkey_manager):
+        """Test spaces around combination parts are ignored"""
+        assert hotkey_manager._parse_hotkey("cmd + shift + r") == "<cmd>+<shift>+r"
+        assert hotkey_manager._parse_hotkey(" option+space ") == "<alt>+<space>"
+    
+    def test_parse_hotkey_is_memoized(self, hotkey_manager):
+        """Test repeated parses are served from the cache"""
+        HotkeyManager._parse_hotkey.cache_clear()
+        
+        hotkey_manager._parse_hotkey("cmd+shift+r")
+        HotkeyManager()._parse_hotkey("cmd+shift+r")
+        
+        info = HotkeyManager._parse_hotkey.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+    
     def test_parse_hotkey_platform_specific(self, hotkey_manager):
         """Test platform-specific key mappings"""
         # Command key variations
@@ -191,6 +221,25 @@ class TestHotkeyManager:
         # Callback was still called
         callback.assert_called_once()
     
+    @patch('whisper_transcriber.hotkey_manager.time.monotonic')
+    @patch('whisper_transcriber.hotkey_manager.logger')
+    def test_hotkey_callback_errors_are_rate_limited(self, mock_logger, mock_monotonic, hotkey_manager):
+        """Test repeated callback errors are logged at most once per interval"""
+        callback = Mock(side_effect=Exception("Callback error"))
+        wrapped_callback = hotkey_manager._wrap_callback(callback)
+        
+        mock_monotonic.return_value = 100.0
+        for _ in range(5):
+            wrapped_callback()
+        assert callback.call_count == 5
+        mock_logger.error.assert_called_once()
+        
+        # Next error after the interval reports the suppressed count
+        mock_monotonic.return_value = 100.0 + hotkey_manager.CALLBACK_ERROR_LOG_INTERVAL
+        wrapped_callback()
+        assert mock_logger.error.call_count == 2
+        assert "4 similar errors suppressed" in mock_logger.error.call_args[0][0]
+    
     def test_get_registered_hotkeys(self, hotkey_manager):
         """Test getting list of registered hotkeys"""
         hotkey_manager.register_hotkey("cmd+shift+r", Mock())
@@ -209,6 +258,20 @@ class TestHotkeyManager:
         assert hotkey_manager.is_hotkey_registered("cmd+shift+r") is True
         assert hotkey_manager.is_hotkey_registered("cmd+shift+t") is False
     
+    def test_registered_hotkeys_view_tracks_changes(self, hotkey_manager):
+        """Test the lock-free view is republished on every change"""
+        hotkey_manager.register_hotkey("cmd+shift+r", Mock())
+        hotkey_manager.register_hotkey("cmd+shift+t", Mock())
+        view = hotkey_manager._hotkeys_view
+        
+        hotkey_manager.unregister_hotkey("cmd+shift+r")
+        assert "cmd+shift+r" in view  # Old snapshots are never mutated
+        assert hotkey_manager.is_hotkey_registered("cmd+shift+r") is False
+        assert hotkey_manager.get_registered_hotkeys() == ["cmd+shift+t"]
+        
+        hotkey_manager.clear_all_hotkeys()
+        assert hotkey_manager.get_registered_hotkeys() == []
+    
     def test_clear_all_hotkeys(self, hotkey_manager):
         """Test clearing all registered hotkeys"""
         hotkey_manager.register_hotkey("cmd+shift+r", Mock())
@@ -218,6 +281,36 @@ class TestHotkeyManager:
         
         assert len(hotkey_manager.hotkeys) == 0
     
+    @patch('whisper_transcriber.hotkey_manager.keyboard.GlobalHotKeys')
+    def test_clear_all_hotkeys_while_listening(self, mock_global_hotkeys, hotkey_manager):
+        """Test clearing hotkeys stops a running listener without deadlocking"""
+        mock_listener = MagicMock()
+        mock_global_hotkeys.return_value = mock_listener
+        hotkey_manager.register_hotkey("cmd+shift+r", Mock())
+        hotkey_manager.start_listening()
+        
+        hotkey_manager.clear_all_hotkeys()
+        
+        mock_listener.stop.assert_called_once()
+        assert hotkey_manager.listener is None
+        assert hotkey_manager._is_listening is False
+    
+    @patch('whisper_transcriber.hotkey_manager.keyboard.GlobalHotKeys')
+    def test_listener_stop_can_reenter_manager(self, mock_global_hotkeys, hotkey_manager):
+        """Test hotkey changes made while a listener stops do not deadlock"""
+        mock_listener = MagicMock()
+        mock_global_hotkeys.return_value = mock_listener
+        hotkey_manager.register_hotkey("cmd+shift+r", Mock())
+        hotkey_manager.start_listening()
+        
+        # Simulate a callback on the listener thread rebinding a hotkey
+        mock_listener.stop.side_effect = lambda: hotkey_manager.register_hotkey(
+            "cmd+shift+x", Mock()
+        )
+        hotkey_manager.stop_listening()
+        
+        assert hotkey_manager.is_hotkey_registered("cmd+shift+x")
+    
     @patch('whisper_transcriber.hotkey_manager.keyboard.GlobalHotKeys')
     def test_restart_listener_after_hotkey_change(self, mock_global_hotkeys, hotkey_manager):
         """Test listener is restarted when hotkeys change while listening"""
@@ -230,11 +323,34 @@ class TestHotkeyManager:
         
         # Register new hotkey while listening
         hotkey_manager.register_hotkey("cmd+shift+t", Mock())
+        hotkey_manager._restart_timer.join(timeout=1)
         
         # Should restart listener
         assert mock_listener.stop.call_count >= 1
         assert mock_global_hotkeys.call_count >= 2
     
+    @patch('whisper_transcriber.hotkey_manager.keyboard.GlobalHotKeys')
+    def test_restart_listener_is_debounced(self, mock_global_hotkeys, hotkey_manager):
+        """Test several hotkey changes result in a single listener restart"""
+        mock_listener = MagicMock()
+        mock_global_hotkeys.return_value = mock_listener
+        
+        hotkey_manager.register_hotkey("cmd+shift+r", Mock())
+        hotkey_manager.start_listening()
+        
+        hotkey_manager.register_hotkey("cmd+shift+t", Mock())
+        hotkey_manager.register_hotkey("cmd+shift+u", Mock())
+        hotkey_manager.unregister_hotkey("cmd+shift+t")
+        assert mock_global_hotkeys.call_count == 1
+        
+        hotkey_manager._restart_timer.join(timeout=1)
+        
+        assert mock_listener.stop.call_count == 1
+        assert mock_global_hotkeys.call_count == 2
+        assert set(mock_global_hotkeys.call_args[0][0]) == {
+            '<cmd>+<shift>+r', '<cmd>+<shift>+u'
+        }
+    
     def test_thread_safety(self, hotkey_manager):
         """Test thread-safe operations"""
         callbacks = [Mock() for _ in range(10)]
@@ -40,7 +40,7 @@ class MockApp:
 mock_rumps.App = MockApp
 sys.modules['rumps'] = mock_rumps
 
-from whisper_transcriber.main import WhisperTranscriberApp, main
+from whisper_transcriber.main import WhisperTranscriberApp, main, _is_gil_enabled
 
 
 class TestWhisperTranscriberApp:
@@ -72,8 +72,9 @@ class TestWhisperTranscriberApp:
             'audio_device_id': None
         }.get(key, default)
         
-        # Create app
+        # Create app and let the background server warmup finish
         app = WhisperTranscriberApp()
+        app._server_warmup.join(timeout=5)
         return app
     
     def test_init(self, app, mock_dependencies):
@@ -122,17 +123,35 @@ class TestWhisperTranscriberApp:
         app.transcription_service.is_server_running.return_value = False
         app.transcription_service.start_server.return_value = False
         
-        # Mock rumps.alert to prevent blocking dialog
-        with patch('whisper_transcriber.main.rumps.alert'):
-            # Try to start recording
+        with patch('whisper_transcriber.main.rumps.notification') as mock_notify:
+            # Try to start recording; the server is started in the background
             app.toggle_recording(None)
+            app._server_warmup.join(timeout=5)
         
         # Should not start recording
         assert app.is_recording is False
         app.audio_capture.start_recording.assert_not_called()
         app.transcription_service.is_server_running.assert_called_once()
-        # start_server is called twice: once on init, once in toggle_recording
+        # start_server is called twice: once on init, once for the recording
         assert app.transcription_service.start_server.call_count == 2
+        titles = [c[1]['title'] for c in mock_notify.call_args_list]
+        assert titles == ["Starting...", "Server Error"]
+
+    def test_toggle_recording_refused_during_server_warmup(self, app):
+        """Test recording is refused without waiting while the server warms up"""
+        app.transcription_service.is_server_running.return_value = True
+        app._server_warmup = MagicMock()
+        app._server_warmup.is_alive.return_value = True
+
+        with patch('whisper_transcriber.main.rumps.notification') as mock_notify:
+            app.toggle_recording(None)
+
+        app._server_warmup.join.assert_not_called()
+        mock_notify.assert_called_once()
+        app.transcription_service.connect_websocket.assert_not_called()
+        # Only the init warmup started the server
+        assert app.transcription_service.start_server.call_count == 1
+        assert app.is_recording is False
     
     def test_toggle_recording_websocket_failure(self, app):
         """Test handling WebSocket connection failure"""
@@ -190,6 +209,63 @@ class TestWhisperTranscriberApp:
         assert call_args[0][0] == text  # First positional arg
         assert call_args[0][1].value == 'clipboard'  # Second arg is InsertMethod enum
     
+    def test_handle_transcription_cumulative_final(self, app):
+        """Test growing final transcriptions only insert the new text"""
+        app.config_manager.get.side_effect = lambda key, default=None: {
+            'insertion_method': 'clipboard'
+        }.get(key, default)
+        
+        app._handle_transcription("Hello", is_final=True)
+        app._handle_transcription("Hello world", is_final=True)
+        app._handle_transcription("Hello world", is_final=True)
+        app._handle_transcription("Goodbye", is_final=True)
+        
+        inserted = [c[0][0] for c in app.text_inserter.insert_text.call_args_list]
+        assert inserted == ["Hello", " world", "Goodbye"]
+    
+    def test_handle_transcription_revised_early_word_is_not_extension(self, app):
+        """Test a final revision of an earlier word is inserted whole, not as a tail"""
+        app.config_manager.get.side_effect = lambda key, default=None: {
+            'insertion_method': 'clipboard'
+        }.get(key, default)
+        prefix = "word " * 20
+        
+        app._handle_transcription("Hello " + prefix, is_final=True)
+        app._handle_transcription("Jello " + prefix + "more", is_final=True)
+        
+        inserted = [c[0][0] for c in app.text_inserter.insert_text.call_args_list]
+        assert inserted == ["Hello " + prefix, "Jello " + prefix + "more"]
+    
+    def test_insert_method_cached_until_preferences_saved(self, app):
+        """Test the insertion method is resolved once until settings change"""
+        settings = {'insertion_method': 'clipboard'}
+        app.config_manager.get.side_effect = lambda key, default=None: settings.get(key, default)
+        
+        app._handle_transcription("One", is_final=True)
+        settings['insertion_method'] = 'keyboard'
+        app._handle_transcription("One two", is_final=True)
+        assert app.text_inserter.insert_text.call_args[0][1].value == 'clipboard'
+        
+        app._on_preferences_saved()
+        app._handle_transcription("One two three", is_final=True)
+        assert app.text_inserter.insert_text.call_args[0][1].value == 'keyboard'
+    
+    def test_insertion_failure_is_logged_from_future(self, app):
+        """Test insertion errors raised on the worker are logged on completion"""
+        app.config_manager.get.side_effect = lambda key, default=None: {
+            'insertion_method': 'clipboard'
+        }.get(key, default)
+        
+        app._handle_transcription("Hello", is_final=True)
+        future = app.text_inserter.insert_text.return_value
+        on_done = future.add_done_callback.call_args[0][0]
+        future.exception.return_value = RuntimeError("paste failed")
+        
+        with patch('whisper_transcriber.main.logger') as mock_logger:
+            on_done(future)
+        
+        assert "paste failed" in mock_logger.error.call_args[0][0]
+    
     def test_handle_transcription_partial(self, app):
         """Test handling partial transcription (ignored)"""
         text = "Hello"
@@ -207,7 +283,8 @@ class TestWhisperTranscriberApp:
             mock_prefs.assert_called_once_with(
                 app.config_manager,
                 app.audio_capture,
-                app.hotkey_manager
+                app.hotkey_manager,
+                on_save=app._on_preferences_saved
             )
             mock_prefs.return_value.show.assert_called_once()
     
@@ -224,8 +301,20 @@ class TestWhisperTranscriberApp:
         app.audio_capture.stop_recording.assert_called_once()
         app.transcription_service.stop_server.assert_called_once()
         app.hotkey_manager.stop_listening.assert_called_once()
+        app.config_manager.flush.assert_called_once()
         mock_quit.assert_called_once()
     
+    @patch('whisper_transcriber.main.rumps.quit_application')
+    def test_quit_application_disconnects_when_idle(self, mock_quit, app):
+        """Test quitting closes a pre-warmed connection while not recording"""
+        app.is_recording = False
+        
+        app.quit_application(None)
+        
+        app.audio_capture.stop_recording.assert_not_called()
+        app.transcription_service.disconnect_websocket.assert_called_once()
+        app.transcription_service.stop_server.assert_called_once()
+    
     def test_menu_setup(self, app):
         """Test menu items are properly set up"""
         # Get menu items (menu is a list) and convert titles to strings
@@ -253,6 +342,17 @@ class TestWhisperTranscriberApp:
         assert "About" in menu_titles
         assert "Quit" in menu_titles
     
+    def test_update_menu_item(self, app):
+        """Test recording menu item title follows the recording state"""
+        app.is_recording = True
+        app._update_menu_item()
+        assert app._record_menu_item.title == "Stop Recording"
+        assert app._record_menu_item in app.menu
+        
+        app.is_recording = False
+        app._update_menu_item()
+        assert app._record_menu_item.title == "Start Recording"
+    
     def test_hotkey_registration(self, app):
         """Test hotkey is registered on startup"""
         app.hotkey_manager.register_hotkey.assert_called_once_with(
@@ -286,4 +386,12 @@ class TestMain:
         main()
         
         mock_app_class.assert_called_once()
-        mock_app.run.assert_called_once()
\ No newline at end of file
+        mock_app.run.assert_called_once()
+    
+    def test_is_gil_enabled(self):
+        """Test GIL detection on regular and free-threaded builds"""
+        with patch.object(sys, '_is_gil_enabled', create=True, return_value=False):
+            assert _is_gil_enabled() is False
+        
+        with patch.object(sys, '_is_gil_enabled', create=True, return_value=True):
+            assert _is_gil_enabled() is True
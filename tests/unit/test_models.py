@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from dataclasses import asdict
 
@@ -14,6 +16,7 @@ class TestAudioConfig:
         assert config.channels == 1
         assert config.chunk_size == 1600
         assert config.format == "int16"
+        assert config.batch_chunks == 1
     
     def test_custom_values(self):
         """Test AudioConfig can be initialized with custom values"""
@@ -37,7 +40,8 @@ class TestAudioConfig:
             "sample_rate": 16000,
             "channels": 1,
             "chunk_size": 1600,
-            "format": "int16"
+            "format": "int16",
+            "batch_chunks": 1
         }
     
     def test_immutability(self):
@@ -105,6 +109,13 @@ class TestServerConfig:
         config = ServerConfig(host="127.0.0.1", port=8080)
         assert config.websocket_url == "ws://127.0.0.1:8080/asr"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_configs_use_slots(self):
+        """Test config and device instances carry no per-instance __dict__"""
+        device = AudioDevice(id=0, name="Mic", channels=1, sample_rate=16000)
+        for instance in (AudioConfig(), ServerConfig(), device):
+            assert not hasattr(instance, "__dict__")
+
 
 class TestAudioDevice:
     """Test suite for AudioDevice dataclass"""
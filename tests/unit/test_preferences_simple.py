@@ -0,0 +1,225 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Mock UI libraries before importing the preferences window
+sys.modules.setdefault('rumps', MagicMock())
+
+from whisper_transcriber import preferences_simple
+from whisper_transcriber.models import AudioDevice
+from whisper_transcriber.preferences_simple import (
+    SimplePreferencesWindow,
+    _get_device_choices,
+    _parse_form,
+)
+
+
+DEVICES = [
+    AudioDevice(id=3, name="MacBook Microphone", channels=1, sample_rate=48000, is_default=True),
+    AudioDevice(id=7, name="USB Headset", channels=2, sample_rate=44100),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_device_cache():
+    """Start every test without cached device choices"""
+    preferences_simple._device_cache = None
+    yield
+    preferences_simple._device_cache = None
+
+
+@pytest.fixture
+def audio_capture():
+    """Create an audio capture mock listing two input devices"""
+    capture = MagicMock()
+    capture.list_devices.return_value = DEVICES
+    return capture
+
+
+class TestParseForm:
+    """Test suite for the preferences form parser"""
+
+    def test_parses_key_value_lines(self):
+        """Test each line is split at the first colon"""
+        values = _parse_form("hotkey: cmd+shift+r\nmicrophone: USB (2ch, 44100Hz)")
+        assert values == {"hotkey": "cmd+shift+r", "microphone": "USB (2ch, 44100Hz)"}
+
+    def test_reordered_and_deleted_lines(self):
+        """Test lines may be reordered or removed"""
+        values = _parse_form("language: fr\nHotkey : alt+space\nnot a setting")
+        assert values == {"language": "fr", "hotkey": "alt+space"}
+
+    def test_blank_values_are_left_out(self):
+        """Test blank values are dropped so the old setting is kept"""
+        assert _parse_form("model:\nlanguage:   \nhotkey: f5") == {"hotkey": "f5"}
+
+
+class TestDeviceChoices:
+    """Test suite for microphone choices"""
+
+    def test_find_by_number(self, audio_capture):
+        """Test a 1-based number selects the listed device"""
+        choices = _get_device_choices(audio_capture)
+        assert choices.find("1") is None
+        assert choices.find("3") == 7
+        with pytest.raises(KeyError):
+            choices.find("9")
+
+    def test_find_by_exact_name(self, audio_capture):
+        """Test the full description matches case-insensitively"""
+        choices = _get_device_choices(audio_capture)
+        assert choices.find("usb headset (2ch, 44100Hz)") == 7
+        assert choices.find("default") is None
+
+    def test_find_by_substring(self, audio_capture):
+        """Test a partial name falls back to substring matching"""
+        choices = _get_device_choices(audio_capture)
+        assert choices.find("macbook") == 3
+
+    def test_find_no_match(self, audio_capture):
+        """Test input matching no device raises KeyError"""
+        choices = _get_device_choices(audio_capture)
+        with pytest.raises(KeyError):
+            choices.find("studio interface")
+
+    def test_choices_cached_within_ttl(self, audio_capture):
+        """Test devices are enumerated once per cache period"""
+        with patch('whisper_transcriber.preferences_simple.time.monotonic') as mock_time:
+            mock_time.return_value = 100.0
+            first = _get_device_choices(audio_capture)
+            mock_time.return_value = 104.0
+            assert _get_device_choices(audio_capture) is first
+            assert audio_capture.list_devices.call_count == 1
+
+            mock_time.return_value = 106.0
+            assert _get_device_choices(audio_capture) is not first
+            assert audio_capture.list_devices.call_count == 2
+
+
+class TestSimplePreferencesWindow:
+    """Test suite for SimplePreferencesWindow"""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Create a config manager mock backed by a dict"""
+        settings = {
+            "hotkey": "cmd+shift+r",
+            "model": "tiny.en",
+            "language": "en",
+            "insertion_method": "clipboard",
+            "audio_device_id": 7,
+            "start_at_login": False,
+        }
+        manager = MagicMock()
+        manager.settings = settings
+        manager.get.side_effect = lambda key, default=None: settings.get(key, default)
+        manager.set.side_effect = settings.__setitem__
+        return manager
+
+    @pytest.fixture
+    def mock_rumps(self):
+        """Mock the rumps dialog, alert and notification"""
+        with patch('whisper_transcriber.preferences_simple.rumps') as mock_rumps:
+            yield mock_rumps
+
+    @pytest.fixture
+    def window(self, config_manager, audio_capture, mock_rumps):
+        """Create a preferences window with a mocked startup manager"""
+        with patch('whisper_transcriber.preferences_simple.StartupManager') as mock_startup:
+            mock_startup.return_value.is_startup_enabled.return_value = False
+            mock_startup.return_value.toggle_startup.return_value = True
+            prefs = SimplePreferencesWindow(
+                config_manager, audio_capture, MagicMock(), on_save=MagicMock()
+            )
+        return prefs
+
+    def submit(self, window, mock_rumps, text, clicked=1):
+        """Show the window and answer the dialog with text"""
+        mock_rumps.Window.return_value.run.return_value = MagicMock(
+            clicked=clicked, text=text
+        )
+        window.show()
+
+    def test_form_shows_current_settings(self, window, mock_rumps):
+        """Test the dialog is prefilled with the current values"""
+        self.submit(window, mock_rumps, "", clicked=0)
+
+        form = mock_rumps.Window.call_args[1]['default_text']
+        assert "hotkey: cmd+shift+r" in form
+        assert "microphone: USB Headset (2ch, 44100Hz)" in form
+        assert "start_at_login: no" in form
+
+    def test_cancel_changes_nothing(self, window, mock_rumps, config_manager):
+        """Test cancelling the dialog saves nothing"""
+        self.submit(window, mock_rumps, "hotkey: f5", clicked=0)
+
+        config_manager.set.assert_not_called()
+        config_manager.save.assert_not_called()
+        window.startup_manager.toggle_startup.assert_not_called()
+        window.on_save.assert_not_called()
+
+    def test_save_applies_edited_values(self, window, mock_rumps, config_manager):
+        """Test reordered lines are applied and deleted ones keep their value"""
+        self.submit(
+            window, mock_rumps,
+            "language: fr\nhotkey: alt+space\nmicrophone: 2\nstart_at_login: Yes",
+        )
+
+        settings = config_manager.settings
+        assert settings["language"] == "fr"
+        assert settings["hotkey"] == "alt+space"
+        assert settings["model"] == "tiny.en"
+        assert settings["insertion_method"] == "clipboard"
+        assert settings["audio_device_id"] == 3
+        assert settings["audio_device"] == "3"
+        assert settings["start_at_login"] is True
+        window.startup_manager.toggle_startup.assert_called_once_with(True)
+        config_manager.save.assert_called()
+        window.on_save.assert_called_once()
+
+    @pytest.mark.parametrize("answer,expected", [
+        ("yes", True), ("on", True), ("1", True), ("no", False), ("nope", False),
+    ])
+    def test_start_at_login_parsing(self, window, mock_rumps, config_manager, answer, expected):
+        """Test yes/no spellings for start at login"""
+        self.submit(window, mock_rumps, f"start_at_login: {answer}")
+
+        assert config_manager.settings["start_at_login"] is expected
+        window.startup_manager.toggle_startup.assert_called_once_with(expected)
+
+    def test_changing_start_at_login_removes_legacy_items_once(self, window, mock_rumps, config_manager):
+        """Test legacy login items are removed on the first change only"""
+        self.submit(window, mock_rumps, "start_at_login: no")
+        window.startup_manager.remove_legacy_login_items.assert_not_called()
+
+        self.submit(window, mock_rumps, "start_at_login: yes")
+        window.startup_manager.remove_legacy_login_items.assert_called_once()
+        assert config_manager.settings["legacy_login_items_removed"] is True
+
+        window.startup_manager.is_startup_enabled.return_value = True
+        self.submit(window, mock_rumps, "start_at_login: no")
+        window.startup_manager.remove_legacy_login_items.assert_called_once()
+
+    def test_blank_values_keep_old_settings(self, window, mock_rumps, config_manager):
+        """Test clearing a value keeps the previous setting"""
+        self.submit(
+            window, mock_rumps,
+            "hotkey:\nmodel: \nlanguage:\ninsertion_method:\nmicrophone:\nstart_at_login:",
+        )
+
+        settings = config_manager.settings
+        assert settings["hotkey"] == "cmd+shift+r"
+        assert settings["model"] == "tiny.en"
+        assert settings["language"] == "en"
+        assert settings["insertion_method"] == "clipboard"
+        assert settings["audio_device_id"] == 7
+        assert settings["start_at_login"] is False
+
+    @pytest.mark.parametrize("microphone", ["9", "studio interface"])
+    def test_invalid_microphone_keeps_current_device(self, window, mock_rumps, config_manager, microphone):
+        """Test microphone input matching no device keeps the current one"""
+        self.submit(window, mock_rumps, f"microphone: {microphone}")
+
+        assert config_manager.settings["audio_device_id"] == 7
+        assert config_manager.settings["audio_device"] == "7"
@@ -0,0 +1,99 @@
+import plistlib
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from whisper_transcriber.startup_manager import StartupManager
+
+
+class TestStartupManager:
+    """Test suite for StartupManager class"""
+
+    @pytest.fixture
+    def mock_osascript(self):
+        """Mock osascript calls used to remove legacy login items"""
+        with patch('whisper_transcriber.startup_manager.subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            yield mock_run
+
+    @pytest.fixture
+    def startup_manager(self, tmp_path, mock_osascript):
+        """Create a StartupManager writing its plist to a temp directory"""
+        with patch('whisper_transcriber.startup_manager.os.path.exists', return_value=False):
+            manager = StartupManager()
+        manager.plist_path = tmp_path / "LaunchAgents" / "com.whispertranscriber.plist"
+        return manager
+
+    def test_program_arguments_for_app_bundle(self, startup_manager):
+        """Test an installed app bundle is launched with open -a"""
+        startup_manager.bundle_path = "/Applications/WhisperTranscriber.app"
+
+        assert startup_manager._program_arguments() == [
+            "/usr/bin/open", "-a", "/Applications/WhisperTranscriber.app"
+        ]
+
+    def test_program_arguments_without_bundle(self, startup_manager):
+        """Test the package is run with the current interpreter when not bundled"""
+        assert startup_manager.bundle_path == sys.executable
+        assert startup_manager._program_arguments() == [
+            sys.executable, "-m", "whisper_transcriber.main"
+        ]
+
+    def test_enable_startup_writes_plist(self, startup_manager):
+        """Test enabling startup writes the LaunchAgent plist"""
+        assert startup_manager.is_startup_enabled() is False
+
+        assert startup_manager.enable_startup() is True
+
+        with open(startup_manager.plist_path, "rb") as f:
+            agent = plistlib.load(f)
+        assert agent == {
+            "Label": "com.whispertranscriber",
+            "ProgramArguments": [sys.executable, "-m", "whisper_transcriber.main"],
+            "RunAtLoad": True,
+            "KeepAlive": False,
+        }
+        assert startup_manager.is_startup_enabled() is True
+
+    def test_disable_startup_removes_plist(self, startup_manager):
+        """Test disabling startup deletes the plist"""
+        startup_manager.enable_startup()
+
+        assert startup_manager.disable_startup() is True
+        assert not startup_manager.plist_path.exists()
+        assert startup_manager.is_startup_enabled() is False
+
+    def test_disable_startup_when_not_installed(self, startup_manager):
+        """Test disabling startup succeeds when no plist exists"""
+        assert startup_manager.disable_startup() is True
+
+    def test_enable_and_disable_do_not_script_system_events(self, startup_manager, mock_osascript):
+        """Test applying the setting only touches the plist"""
+        startup_manager.enable_startup()
+        startup_manager.disable_startup()
+
+        mock_osascript.assert_not_called()
+
+    def test_remove_legacy_login_items(self, startup_manager, mock_osascript):
+        """Test login items created by earlier versions are deleted"""
+        startup_manager.remove_legacy_login_items()
+
+        mock_osascript.assert_called_once()
+        script = mock_osascript.call_args[0][0][2]
+        assert 'delete login item "WhisperTranscriber"' in script
+        assert 'tell application "System Events"' in script
+
+    def test_legacy_cleanup_failure_is_ignored(self, startup_manager, mock_osascript):
+        """Test a missing osascript is logged and ignored"""
+        mock_osascript.side_effect = FileNotFoundError("osascript")
+
+        startup_manager.remove_legacy_login_items()
+
+    def test_toggle_startup(self, startup_manager):
+        """Test toggle_startup dispatches to enable or disable"""
+        assert startup_manager.toggle_startup(True) is True
+        assert startup_manager.is_startup_enabled() is True
+
+        assert startup_manager.toggle_startup(False) is True
+        assert startup_manager.is_startup_enabled() is False
@@ -1,10 +1,16 @@
+import threading
 import time
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, MagicMock, patch, call
+
+from pynput import keyboard
 
 from whisper_transcriber.text_inserter import TextInserter
 from whisper_transcriber.models import InsertMethod
 
+# Insert methods bound once at module level
+_CLIP, _KBD, _AUTO = InsertMethod.CLIPBOARD, InsertMethod.KEYBOARD, InsertMethod.AUTO
+
 
 class TestTextInserter:
     """Test suite for TextInserter class"""
@@ -12,7 +18,12 @@ class TestTextInserter:
     @pytest.fixture
     def text_inserter(self):
         """Create TextInserter instance"""
-        return TextInserter()
+        inserter = TextInserter()
+        yield inserter
+        # Drop restores scheduled while the clipboard mocks were active
+        with inserter._clipboard_lock:
+            inserter._cancel_restore()
+        inserter.close()
     
     def test_init(self, text_inserter):
         """Test TextInserter initialization"""
@@ -26,7 +37,8 @@ class TestTextInserter:
         mock_pyperclip.paste.return_value = "original content"
         
         # Insert text
-        text_inserter.insert_text("Hello World", method=InsertMethod.CLIPBOARD)
+        text_inserter.insert_text("Hello World", method=_CLIP).result()
+        text_inserter.flush()
         
         # Verify clipboard operations
         mock_pyperclip.paste.assert_called_once()  # Save original
@@ -45,7 +57,7 @@ class TestTextInserter:
         mock_controller_class.return_value = mock_controller
         
         # Insert text
-        text_inserter.insert_text("Hello", method=InsertMethod.KEYBOARD)
+        text_inserter.insert_text("Hello", method=_KBD).result()
         
         # Verify keyboard typing
         mock_controller.type.assert_called_once_with("Hello")
@@ -63,7 +75,7 @@ class TestTextInserter:
         mock_controller_class.return_value = mock_controller
         
         # Insert short text
-        text_inserter.insert_text("Hi", method=InsertMethod.AUTO)
+        text_inserter.insert_text("Hi", method=_AUTO).result()
         
         # Should use keyboard method for short text
         mock_controller.type.assert_called_once_with("Hi")
@@ -80,7 +92,7 @@ class TestTextInserter:
         long_text = "This is a very long text that exceeds the threshold for keyboard typing method"
         mock_pyperclip.paste.return_value = "original"
         
-        text_inserter.insert_text(long_text, method=InsertMethod.AUTO)
+        text_inserter.insert_text(long_text, method=_AUTO).result()
         
         # Should use clipboard method for long text
         mock_pyperclip.copy.assert_any_call(long_text)
@@ -97,7 +109,7 @@ class TestTextInserter:
         text_with_newlines = "Line 1\nLine 2"
         mock_pyperclip.paste.return_value = "original"
         
-        text_inserter.insert_text(text_with_newlines, method=InsertMethod.AUTO)
+        text_inserter.insert_text(text_with_newlines, method=_AUTO).result()
         
         # Should use clipboard method for text with newlines
         mock_pyperclip.copy.assert_any_call(text_with_newlines)
@@ -111,6 +123,7 @@ class TestTextInserter:
         
         with patch('whisper_transcriber.text_inserter.keyboard.Controller'):
             text_inserter._clipboard_method("new text")
+        text_inserter.flush()
         
         # Verify restoration
         calls = mock_pyperclip.copy.call_args_list
@@ -124,25 +137,23 @@ class TestTextInserter:
         
         with patch('whisper_transcriber.text_inserter.keyboard.Controller'):
             text_inserter._clipboard_method("new text")
+        text_inserter.flush()
         
         # Should still work with empty clipboard
         mock_pyperclip.copy.assert_any_call("new text")
         mock_pyperclip.copy.assert_any_call("")
     
     @patch('whisper_transcriber.text_inserter.pyperclip')
-    def test_clipboard_method_paste_error(self, mock_pyperclip, text_inserter):
-        """Test clipboard method handles paste errors gracefully"""
-        mock_pyperclip.paste.side_effect = Exception("Clipboard error")
+    def test_clipboard_restore_skipped_for_same_text(self, mock_pyperclip, text_inserter):
+        """Test no restore is written when the clipboard already held the text"""
+        mock_pyperclip.paste.return_value = "same text"
         
         with patch('whisper_transcriber.text_inserter.keyboard.Controller'):
-            # Should not raise exception
-            text_inserter._clipboard_method("new text")
+            text_inserter._clipboard_method("same text")
+        text_inserter.flush()
         
-        # Should still copy new text (first call is to copy the new text)
-        assert mock_pyperclip.copy.call_count == 2
-        assert mock_pyperclip.copy.call_args_list[0][0][0] == "new text"
-        # Second call is to restore the clipboard (empty string due to paste error)
-        assert mock_pyperclip.copy.call_args_list[1][0][0] == ""
+        mock_pyperclip.copy.assert_called_once_with("same text")
+        assert text_inserter.original_clipboard is None
     
     @patch('whisper_transcriber.text_inserter.keyboard.Controller')
     def test_keyboard_method_special_characters(self, mock_controller_class, text_inserter):
@@ -168,90 +179,142 @@ class TestTextInserter:
         
         mock_controller.type.assert_called_once_with(unicode_text)
     
+    @patch('whisper_transcriber.text_inserter.platform.system', return_value="Darwin")
+    @patch('whisper_transcriber.text_inserter.keyboard.Controller')
+    def test_controller_reused_with_cached_paste_modifier(self, mock_controller_class, mock_platform):
+        """Test one controller serves every insertion and pastes with cmd on macOS"""
+        text_inserter = TextInserter()
+        mock_controller = MagicMock()
+        mock_controller_class.return_value = mock_controller
+        
+        text_inserter._keyboard_method("Hello")
+        text_inserter._paste_with_keyboard()
+        
+        mock_controller_class.assert_called_once()
+        mock_controller.pressed.assert_called_once_with(text_inserter._paste_modifier)
+        assert text_inserter._paste_modifier is keyboard.Key.cmd
+    
+    @patch('whisper_transcriber.text_inserter.Quartz', create=True)
+    @patch('whisper_transcriber.text_inserter.keyboard.Controller')
+    def test_keyboard_method_posts_unicode_events_on_mac(self, mock_controller_class, mock_quartz, text_inserter):
+        """Test macOS typing posts one key down/up pair per 20 UTF-16 units"""
+        text_inserter._platform = "Darwin"
+        text = "a" * 19 + "🌍" + "b" * 5
+        
+        text_inserter._keyboard_method(text)
+        
+        # The emoji needs two units, so it starts the second chunk
+        chunks = [c[0][1:] for c in mock_quartz.CGEventKeyboardSetUnicodeString.call_args_list]
+        assert chunks == [(19, "a" * 19)] * 2 + [(7, "🌍" + "b" * 5)] * 2
+        assert mock_quartz.CGEventPost.call_count == 4
+        mock_controller_class.return_value.type.assert_not_called()
+        
+        # Newlines still go through pynput key presses
+        text_inserter._keyboard_method("a\nb")
+        mock_controller_class.return_value.type.assert_called_once_with("a\nb")
+    
+    def test_insert_text_runs_on_worker_thread(self, text_inserter):
+        """Test insertions run in order on the dedicated worker thread"""
+        threads = []
+        
+        def record(text):
+            threads.append((text, threading.current_thread().name))
+        
+        with patch.object(text_inserter, '_keyboard_method', side_effect=record):
+            first = text_inserter.insert_text("one", method=_KBD)
+            second = text_inserter.insert_text("two", method=_KBD)
+            second.result(timeout=2)
+        
+        assert first.done()
+        assert [t[0] for t in threads] == ["one", "two"]
+        assert all(name.startswith("text-insert") for _, name in threads)
+    
     def test_invalid_insert_method(self, text_inserter):
         """Test handling of invalid insert method"""
         with pytest.raises(ValueError):
             text_inserter.insert_text("text", method="invalid_method")
     
-    @patch('whisper_transcriber.text_inserter.time.sleep')
-    @patch('whisper_transcriber.text_inserter.pyperclip')
     @patch('whisper_transcriber.text_inserter.keyboard.Controller')
-    def test_timing_delays(self, mock_controller_class, mock_pyperclip, mock_sleep, text_inserter):
-        """Test proper timing delays are used"""
-        # Setup mock controller with context manager support
-        mock_controller = Mock()
-        mock_controller_class.return_value = mock_controller
-        mock_controller.pressed = Mock()
-        mock_controller.pressed.return_value.__enter__ = Mock()
-        mock_controller.pressed.return_value.__exit__ = Mock()
+    def test_insert_text_accepts_method_names(self, mock_controller_class, text_inserter):
+        """Test insertion methods can be given by their string value"""
+        text_inserter.insert_text("Hi", method="keyboard").result()
         
+        mock_controller_class.return_value.type.assert_called_once_with("Hi")
+    
+    @patch('whisper_transcriber.text_inserter.pyperclip')
+    @patch('whisper_transcriber.text_inserter.keyboard.Controller')
+    def test_clipboard_restore_is_deferred(self, mock_controller_class, mock_pyperclip, text_inserter):
+        """Test the original clipboard is restored after the delay, not inline"""
+        mock_controller_class.return_value = MagicMock()
         mock_pyperclip.paste.return_value = "original"
+        text_inserter.RESTORE_DELAY_SECONDS = 0.01
         
         text_inserter._clipboard_method("text")
         
-        # Verify delays are called
-        assert mock_sleep.call_count >= 2  # At least 2 delays
+        # Only the new text has been copied when the method returns
+        mock_pyperclip.copy.assert_called_once_with("text")
+        timer = text_inserter._restore_timer
+        assert timer is not None
+        timer.join(timeout=2)
+        mock_pyperclip.copy.assert_called_with("original")
+        assert text_inserter._restore_timer is None
     
-    @patch('whisper_transcriber.text_inserter.platform.system')
+    @patch('whisper_transcriber.text_inserter.pyperclip')
     @patch('whisper_transcriber.text_inserter.keyboard.Controller')
-    def test_platform_specific_shortcuts_mac(self, mock_controller_class, mock_platform, text_inserter):
-        """Test platform-specific keyboard shortcuts on macOS"""
-        # Setup mock controller
-        mock_controller = Mock()
-        mock_controller_class.return_value = mock_controller
-        mock_controller.pressed = Mock()
-        mock_controller.pressed.return_value.__enter__ = Mock()
-        mock_controller.pressed.return_value.__exit__ = Mock()
-        
-        mock_platform.return_value = "Darwin"
+    def test_back_to_back_insertions_keep_original_clipboard(self, mock_controller_class, mock_pyperclip, text_inserter):
+        """Test an insertion during a pending restore reuses the saved content"""
+        mock_controller_class.return_value = MagicMock()
+        mock_pyperclip.paste.return_value = "original"
         
-        with patch('whisper_transcriber.text_inserter.pyperclip'):
-            text_inserter._clipboard_method("text")
+        text_inserter._clipboard_method("first")
+        mock_pyperclip.paste.return_value = "first"
+        text_inserter._clipboard_method("second")
+        text_inserter.flush()
         
+        mock_pyperclip.paste.assert_called_once()
+        copied = [c[0][0] for c in mock_pyperclip.copy.call_args_list]
+        assert copied == ["first", "second", "original"]
+    
+    def _paste_on_platform(self, system):
+        """Paste with an inserter created while platform.system returns system"""
+        with patch('whisper_transcriber.text_inserter.platform.system', return_value=system):
+            inserter = TextInserter()
+        try:
+            with patch('whisper_transcriber.text_inserter.keyboard.Controller') as mock_controller_class, \
+                    patch('whisper_transcriber.text_inserter.pyperclip'):
+                mock_controller = MagicMock()
+                mock_controller_class.return_value = mock_controller
+                inserter._clipboard_method("text")
+        finally:
+            with inserter._clipboard_lock:
+                inserter._cancel_restore()
+            inserter.close()
+        return mock_controller
+
+    def test_platform_specific_shortcuts_mac(self):
+        """Test platform-specific keyboard shortcuts on macOS"""
+        mock_controller = self._paste_on_platform("Darwin")
+
         # Verify CMD+V was pressed
-        mock_controller.pressed.assert_called()  # Should be called with Key.cmd
+        mock_controller.pressed.assert_called_with(keyboard.Key.cmd)
         mock_controller.press.assert_called_with('v')
         mock_controller.release.assert_called_with('v')
     
-    @patch('whisper_transcriber.text_inserter.platform.system')
-    @patch('whisper_transcriber.text_inserter.keyboard.Controller')
-    def test_platform_specific_shortcuts_windows(self, mock_controller_class, mock_platform, text_inserter):
+    def test_platform_specific_shortcuts_windows(self):
         """Test platform-specific keyboard shortcuts on Windows"""
-        # Setup mock controller
-        mock_controller = Mock()
-        mock_controller_class.return_value = mock_controller
-        mock_controller.pressed = Mock()
-        mock_controller.pressed.return_value.__enter__ = Mock()
-        mock_controller.pressed.return_value.__exit__ = Mock()
-        
-        mock_platform.return_value = "Windows"
-        
-        with patch('whisper_transcriber.text_inserter.pyperclip'):
-            text_inserter._clipboard_method("text")
-        
+        mock_controller = self._paste_on_platform("Windows")
+
         # Verify CTRL+V was pressed
-        mock_controller.pressed.assert_called()  # Should be called with Key.ctrl
+        mock_controller.pressed.assert_called_with(keyboard.Key.ctrl)
         mock_controller.press.assert_called_with('v')
         mock_controller.release.assert_called_with('v')
     
-    @patch('whisper_transcriber.text_inserter.platform.system')
-    @patch('whisper_transcriber.text_inserter.keyboard.Controller')
-    def test_platform_specific_shortcuts_linux(self, mock_controller_class, mock_platform, text_inserter):
+    def test_platform_specific_shortcuts_linux(self):
         """Test platform-specific keyboard shortcuts on Linux"""
-        # Setup mock controller
-        mock_controller = Mock()
-        mock_controller_class.return_value = mock_controller
-        mock_controller.pressed = Mock()
-        mock_controller.pressed.return_value.__enter__ = Mock()
-        mock_controller.pressed.return_value.__exit__ = Mock()
-        
-        mock_platform.return_value = "Linux"
-        
-        with patch('whisper_transcriber.text_inserter.pyperclip'):
-            text_inserter._clipboard_method("text")
-        
+        mock_controller = self._paste_on_platform("Linux")
+
         # Verify CTRL+V was pressed
-        mock_controller.pressed.assert_called()  # Should be called with Key.ctrl
+        mock_controller.pressed.assert_called_with(keyboard.Key.ctrl)
         mock_controller.press.assert_called_with('v')
         mock_controller.release.assert_called_with('v')
     
@@ -262,24 +325,52 @@ class TestTextInserter:
             mock_controller = Mock()
             mock_controller_class.return_value = mock_controller
             
-            text_inserter.insert_text("", method=InsertMethod.KEYBOARD)
+            text_inserter.insert_text("", method=_KBD).result()
             mock_controller.type.assert_called_once_with("")
     
+    @pytest.mark.parametrize("attr", ["paste", "copy"])
     @patch('whisper_transcriber.text_inserter.pyperclip')
     @patch('whisper_transcriber.text_inserter.keyboard.Controller')
-    def test_fallback_on_clipboard_error(self, mock_controller_class, mock_pyperclip, text_inserter):
-        """Test fallback to keyboard method on clipboard error"""
-        # Setup mock controller
-        mock_controller = Mock()
+    def test_clipboard_error_handling(self, mock_controller_class, mock_pyperclip, attr, text_inserter):
+        """Test clipboard errors are handled gracefully for each clipboard operation"""
+        # Setup mock controller with context manager support
+        mock_controller = MagicMock()
         mock_controller_class.return_value = mock_controller
         
-        mock_pyperclip.copy.side_effect = Exception("Clipboard error")
-        
-        # Should fallback to keyboard method
-        text_inserter.insert_text("Hello", method=InsertMethod.CLIPBOARD)
-        
-        # Verify fallback to keyboard
-        mock_controller.type.assert_called_once_with("Hello")
+        getattr(mock_pyperclip, attr).side_effect = Exception("Clipboard error")
+        
+        # Should not raise exception
+        text_inserter.insert_text("Hello", method=_CLIP).result()
+        text_inserter.flush()
+        
+        if attr == "paste":
+            # Clipboard method still copies the new text, then restores an empty clipboard
+            assert mock_pyperclip.copy.call_count == 2
+            assert mock_pyperclip.copy.call_args_list[0][0][0] == "Hello"
+            assert mock_pyperclip.copy.call_args_list[1][0][0] == ""
+            mock_controller.type.assert_not_called()
+        else:
+            # Copy failure falls back to keyboard method
+            mock_controller.type.assert_called_once_with("Hello")
+    
+    @patch('whisper_transcriber.text_inserter.NSPasteboardTypeString', "public.utf8-plain-text", create=True)
+    @patch('whisper_transcriber.text_inserter.pyperclip')
+    @patch('whisper_transcriber.text_inserter.keyboard.Controller')
+    def test_clipboard_uses_native_pasteboard(self, mock_controller_class, mock_pyperclip, text_inserter):
+        """Test the macOS pasteboard is used instead of pyperclip when available"""
+        mock_controller_class.return_value = MagicMock()
+        pasteboard = Mock()
+        pasteboard.stringForType_.return_value = "original"
+        pasteboard.setString_forType_.return_value = True
+        text_inserter._pasteboard = pasteboard
+        
+        text_inserter._clipboard_method("Hello")
+        text_inserter.flush()
+        
+        written = [c[0] for c in pasteboard.setString_forType_.call_args_list]
+        assert written == [("Hello", "public.utf8-plain-text"), ("original", "public.utf8-plain-text")]
+        mock_pyperclip.paste.assert_not_called()
+        mock_pyperclip.copy.assert_not_called()
     
     @patch('whisper_transcriber.text_inserter.pyperclip')
     def test_get_clipboard_content(self, mock_pyperclip, text_inserter):
@@ -1,11 +1,15 @@
 import asyncio
+import io
 import json
+import orjson
 import pytest
 from unittest.mock import Mock, MagicMock, patch, AsyncMock, call
+import socket
 import subprocess
 import threading
 import time
 import websocket
+from dataclasses import replace
 
 from whisper_transcriber.transcriber import TranscriptionService, TranscriptionError
 from whisper_transcriber.models import ServerConfig
@@ -29,7 +33,9 @@ class TestTranscriptionService:
     @pytest.fixture
     def transcription_service(self, server_config):
         """Create TranscriptionService instance"""
-        return TranscriptionService(server_config)
+        service = TranscriptionService(server_config)
+        yield service
+        service._send_coalescer.close()
     
     def test_init(self, transcription_service, server_config):
         """Test TranscriptionService initialization"""
@@ -52,9 +58,11 @@ class TestTranscriptionService:
         # Mock finding whisperlivekit-server
         mock_which.return_value = '/usr/local/bin/whisperlivekit-server'
         
-        result = transcription_service.start_server()
+        with patch.object(transcription_service, '_wait_for_port', return_value=True) as mock_wait:
+            result = transcription_service.start_server()
         
         assert result is True
+        mock_wait.assert_called_once_with(transcription_service.STARTUP_TIMEOUT)
         assert transcription_service.server_process == mock_process
         
         # Verify correct command was used
@@ -70,6 +78,14 @@ class TestTranscriptionService:
         mock_popen.assert_called_once()
         actual_cmd = mock_popen.call_args[0][0]
         assert actual_cmd == expected_cmd
+        
+        # Options must keep Popen on the posix_spawn fast path
+        kwargs = mock_popen.call_args[1]
+        assert kwargs['executable'] == '/usr/local/bin/whisperlivekit-server'
+        assert kwargs['close_fds'] is False
+        assert kwargs['stderr'] == subprocess.STDOUT
+        for option in ('preexec_fn', 'pass_fds', 'cwd', 'start_new_session', 'shell'):
+            assert option not in kwargs
     
     @patch('whisper_transcriber.transcriber.shutil.which')
     @patch('whisper_transcriber.transcriber.subprocess.Popen')
@@ -85,8 +101,51 @@ class TestTranscriptionService:
         # Mock finding whisperlivekit-server
         mock_which.return_value = '/usr/local/bin/whisperlivekit-server'
         
-        service.start_server()
+        with patch.object(service, '_wait_for_port', return_value=True):
+            service.start_server()
+
+    @patch('whisper_transcriber.transcriber.shutil.which')
+    @patch('whisper_transcriber.transcriber.subprocess.Popen')
+    def test_start_server_returns_when_process_exits(self, mock_popen, mock_which, transcription_service):
+        """Test the startup probe stops as soon as the server process exits"""
+        mock_process = MagicMock()
+        mock_process.poll.return_value = 1
+        mock_process.stdout = io.BytesIO(b"Loading model\nmodel not found\n")
+        mock_popen.return_value = mock_process
+        mock_which.return_value = '/usr/local/bin/whisperlivekit-server'
+
+        start = time.monotonic()
+        result = transcription_service.start_server()
+
+        assert result is False
+        assert time.monotonic() - start < 1
+        assert transcription_service.server_process is None
+        assert list(transcription_service._server_output) == [b"Loading model\n", b"model not found\n"]
+
+    def test_server_output_is_drained_into_bounded_tail(self, transcription_service):
+        """Test server output is read continuously and only the tail is kept"""
+        transcription_service.SERVER_OUTPUT_LINES = 3
+        transcription_service.server_process = MagicMock()
+        transcription_service.server_process.stdout = io.BytesIO(
+            b"".join(b"line %d\n" % i for i in range(10))
+        )
+
+        transcription_service._start_output_drain()
+        transcription_service._output_thread.join(timeout=1)
+
+        assert list(transcription_service._server_output) == [b"line 7\n", b"line 8\n", b"line 9\n"]
+        assert transcription_service.server_process.stdout.closed
+    
+    def test_rebuild_cmd_after_config_change(self, transcription_service):
+        """Test server arguments are cached until rebuilt"""
+        assert "--no-vad" in transcription_service._server_cmd
+        
+        transcription_service.server_config = ServerConfig(vad_enabled=True)
+        assert "--no-vad" in transcription_service._server_cmd
         
+        transcription_service.rebuild_cmd()
+        assert "--no-vad" not in transcription_service._server_cmd
+        assert transcription_service._server_cmd[-1] == "--raw-pcm"
     
     @patch('whisper_transcriber.transcriber.subprocess.Popen')
     def test_start_server_already_running(self, mock_popen, transcription_service):
@@ -145,6 +204,69 @@ class TestTranscriptionService:
         
         assert result is True
     
+    @patch('whisper_transcriber.transcriber.threading.Thread')
+    @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
+    def test_connect_websocket_timeout_closes_single_client(self, mock_websocket_app, mock_thread, transcription_service):
+        """Test one client is created and closed when the connection never opens"""
+        transcription_service.transcription_callback = Mock()
+        transcription_service.CONNECT_TIMEOUT = 0.05
+        mock_ws = mock_websocket_app.return_value
+
+        assert transcription_service.connect_websocket() is False
+
+        mock_websocket_app.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
+        mock_ws.close.assert_called_once()
+        assert transcription_service.websocket_client is None
+
+    def test_connect_websocket_stops_previous_client_thread(self, transcription_service):
+        """Test a client left reconnecting in the background is closed and joined"""
+        transcription_service.transcription_callback = Mock()
+        stopped = threading.Event()
+        stale_client = MagicMock()
+        stale_client.close.side_effect = stopped.set
+        stale_thread = threading.Thread(target=stopped.wait, daemon=True)
+        stale_thread.start()
+        transcription_service.websocket_client = stale_client
+        transcription_service._ws_thread = stale_thread
+
+        with patch('whisper_transcriber.transcriber.threading.Thread') as mock_thread:
+            with patch('whisper_transcriber.transcriber.websocket.WebSocketApp') as mock_websocket_app:
+                mock_thread.return_value.start.side_effect = (
+                    lambda: setattr(transcription_service, 'is_connected', True)
+                )
+                assert transcription_service.connect_websocket() is True
+
+        stale_client.close.assert_called_once()
+        assert not stale_thread.is_alive()
+        assert transcription_service.websocket_client is mock_websocket_app.return_value
+
+    @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
+    def test_websocket_app_requests_no_extensions(self, mock_websocket_app, transcription_service):
+        """Test the client does not request permessage-deflate"""
+        transcription_service._create_websocket_app()
+        
+        kwargs = mock_websocket_app.call_args[1]
+        assert 'header' not in kwargs
+        assert kwargs['on_open'] == transcription_service._on_open
+        assert mock_websocket_app.call_args[0][0] == "ws://localhost:9090/asr"
+    
+    def test_run_websocket_options(self, transcription_service):
+        """Test run_forever socket options, UTF-8 validation and keepalive pings"""
+        client = MagicMock()
+        stop = threading.Event()
+        stop.set()
+        
+        transcription_service._run_websocket(client, stop)
+        
+        client.run_forever.assert_called_once_with(
+            sockopt=transcription_service.SOCKET_OPTIONS,
+            skip_utf8_validation=True, ping_interval=20, ping_timeout=10
+        )
+        assert (
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        ) in transcription_service.SOCKET_OPTIONS
+    
     @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
     def test_connect_websocket_no_callback(self, mock_websocket_app, transcription_service):
         """Test WebSocket connection fails without callback"""
@@ -169,10 +291,55 @@ class TestTranscriptionService:
         
         audio_data = b"test audio data"
         transcription_service.send_audio_chunk(audio_data)
+        transcription_service._send_coalescer.flush()
         
-        # Verify data was sent directly as raw PCM
+        # Verify data was sent as raw PCM
         mock_ws.send.assert_called_once_with(audio_data, opcode=websocket.ABNF.OPCODE_BINARY)
     
+    def test_send_audio_chunk_coalesces_frames(self, transcription_service):
+        """Test small chunks are combined into one frame by the sender thread"""
+        mock_ws = MagicMock()
+        transcription_service.websocket_client = mock_ws
+        transcription_service.is_connected = True
+        coalescer = transcription_service._send_coalescer
+        sent = threading.Event()
+        senders = []
+        
+        def record_send(data, opcode):
+            senders.append((threading.current_thread().name, bytes(data)))
+            sent.set()
+        
+        mock_ws.send.side_effect = record_send
+        coalescer.start()
+        
+        transcription_service.send_audio_chunk(b"abc")
+        transcription_service.send_audio_chunk(memoryview(b"def"))
+        
+        # Pending data is sent once the coalescing delay elapses
+        assert sent.wait(timeout=1)
+        assert senders == [("ws-sender", b"abcdef")]
+        
+        # Reaching the size threshold sends without waiting for the delay
+        sent.clear()
+        coalescer._max_delay = 5
+        transcription_service.send_audio_chunk(b"x" * transcription_service.SEND_COALESCE_BYTES)
+        assert sent.wait(timeout=1)
+        assert len(senders[-1][1]) == transcription_service.SEND_COALESCE_BYTES
+    
+    def test_send_audio_chunk_drops_audio_when_backlog_full(self, transcription_service):
+        """Test the producer drops new chunks instead of blocking on a stalled sender"""
+        mock_ws = MagicMock()
+        transcription_service.websocket_client = mock_ws
+        transcription_service.is_connected = True
+        transcription_service._send_coalescer._max_backlog = 8
+        
+        for chunk in (b"1234", b"5678", b"dropped"):
+            transcription_service.send_audio_chunk(chunk)
+        mock_ws.send.assert_not_called()
+        
+        transcription_service._send_coalescer.flush()
+        mock_ws.send.assert_called_once_with(b"12345678", opcode=websocket.ABNF.OPCODE_BINARY)
+    
     def test_handle_transcription_final(self, transcription_service):
         """Test handling final transcription result"""
         callback = Mock()
@@ -224,6 +391,44 @@ class TestTranscriptionService:
         mock_process.terminate.assert_called_once()
         mock_process.kill.assert_called_once()
     
+    def test_run_websocket_gives_up_reconnecting(self, transcription_service):
+        """Test a client that never reconnects stops after MAX_RECONNECT_ATTEMPTS"""
+        transcription_service.RECONNECT_DELAY = 0
+        client = MagicMock()
+        
+        transcription_service._run_websocket(client, threading.Event())
+        
+        assert client.run_forever.call_count == transcription_service.MAX_RECONNECT_ATTEMPTS + 1
+    
+    def test_run_websocket_reconnect_resets_attempts(self, transcription_service):
+        """Test a successful reconnect starts the attempt count over"""
+        transcription_service.RECONNECT_DELAY = 0
+        client = MagicMock()
+        runs = []
+        
+        def run_forever(**kwargs):
+            runs.append(kwargs)
+            if len(runs) == 5:
+                transcription_service._on_open(client)
+        
+        client.run_forever.side_effect = run_forever
+        transcription_service._run_websocket(client, threading.Event())
+        
+        assert len(runs) == 5 + transcription_service.MAX_RECONNECT_ATTEMPTS
+    
+    def test_stop_server_disconnects_websocket(self, transcription_service):
+        """Test stopping the server closes an idle client so it stops reconnecting"""
+        mock_ws = MagicMock()
+        mock_ws.send.side_effect = websocket.WebSocketConnectionClosedException()
+        transcription_service.websocket_client = mock_ws
+        stop = transcription_service._ws_stop
+        
+        transcription_service.stop_server()
+        
+        mock_ws.close.assert_called_once()
+        assert stop.is_set()
+        assert transcription_service.websocket_client is None
+    
     def test_stop_server_not_running(self, transcription_service):
         """Test stopping server when not running"""
         # Should not raise error
@@ -243,6 +448,117 @@ class TestTranscriptionService:
         assert transcription_service.is_connected is False
         assert transcription_service.websocket_client is None
     
+    def test_send_coalescer_joins_chunks_into_bytes_frames(self, transcription_service):
+        """Test queued chunks are joined into bytes payloads of about max_bytes"""
+        coalescer = transcription_service._send_coalescer
+        coalescer._max_bytes = 8
+        sent = []
+        coalescer._send = sent.append
+        
+        for chunk in (b"1234", memoryview(b"5678"), b"9abc", b"d"):
+            coalescer.add(chunk)
+        coalescer.flush()
+        
+        assert sent == [b"12345678", b"9abcd"]
+        assert all(type(payload) is bytes for payload in sent)
+    
+    def test_send_coalescer_close_does_not_hang_on_blocked_send(self, transcription_service):
+        """Test close returns within its timeout while a send is stuck"""
+        coalescer = transcription_service._send_coalescer
+        coalescer.CLOSE_TIMEOUT = 0.1
+        sending = threading.Event()
+        release = threading.Event()
+        
+        def blocked_send(data):
+            sending.set()
+            release.wait(timeout=5)
+        
+        coalescer._send = blocked_send
+        coalescer.start()
+        coalescer.add(b"stuck")
+        assert sending.wait(timeout=1)
+        coalescer.add(b"pending")
+        
+        try:
+            with patch('whisper_transcriber.transcriber.logger') as mock_logger:
+                start = time.monotonic()
+                coalescer.close()
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+        
+        assert elapsed < 1
+        mock_logger.warning.assert_called_once_with("Audio sender thread did not exit")
+        assert not coalescer._pending
+    
+    def test_send_coalescer_restart_does_not_revive_stuck_sender(self, transcription_service):
+        """Test a sender abandoned by close exits instead of draining beside a new one"""
+        coalescer = transcription_service._send_coalescer
+        coalescer.CLOSE_TIMEOUT = 0.1
+        sending = threading.Event()
+        release = threading.Event()
+        senders = []
+        
+        def send(data):
+            senders.append((threading.current_thread(), data))
+            if data == b"stuck":
+                sending.set()
+                release.wait(timeout=5)
+        
+        coalescer._send = send
+        coalescer.start()
+        coalescer.add(b"stuck")
+        assert sending.wait(timeout=1)
+        stuck_thread = coalescer._thread
+        with patch('whisper_transcriber.transcriber.logger'):
+            coalescer.close()
+        
+        coalescer.start()
+        new_thread = coalescer._thread
+        release.set()
+        
+        for chunk in (b"a", b"b", b"c"):
+            coalescer.add(chunk)
+            time.sleep(0.03)
+        coalescer.close()
+        
+        # The stuck sender exits at its next wake-up without draining
+        stuck_thread.join(timeout=1)
+        assert not stuck_thread.is_alive()
+        
+        assert [thread for thread, _ in senders[1:]] == [new_thread] * 3
+        assert b"".join(data for _, data in senders[1:]) == b"abc"
+    
+    def test_disconnect_websocket_flushes_pending_audio(self, transcription_service):
+        """Test pending audio is sent before the stop signal"""
+        mock_ws = MagicMock()
+        transcription_service.websocket_client = mock_ws
+        transcription_service.is_connected = True
+        
+        transcription_service.send_audio_chunk(b"pending")
+        transcription_service.disconnect_websocket()
+        
+        assert mock_ws.send.call_args_list == [
+            call(b"pending", opcode=websocket.ABNF.OPCODE_BINARY),
+            call(b"", opcode=websocket.ABNF.OPCODE_BINARY),
+        ]
+    
+    def test_disconnect_websocket_returns_on_stop_ack(self, transcription_service):
+        """Test disconnect stops waiting once the server acknowledges the stop"""
+        mock_ws = MagicMock()
+        transcription_service.websocket_client = mock_ws
+        transcription_service.is_connected = True
+        transcription_service.STOP_ACK_TIMEOUT = 5
+        mock_ws.send.side_effect = lambda data, opcode: (
+            transcription_service._on_message(mock_ws, '{"type": "ready_to_stop"}')
+        )
+        
+        start = time.monotonic()
+        transcription_service.disconnect_websocket()
+        
+        assert time.monotonic() - start < 1
+        mock_ws.close.assert_called_once()
+    
     def test_disconnect_websocket_not_connected(self, transcription_service):
         """Test disconnecting when not connected"""
         # Should not raise error
@@ -269,6 +585,66 @@ class TestTranscriptionService:
         # Verify callback called
         callback.assert_called_with("Hello world", True)
     
+    def test_on_message_bytes_and_invalid_json(self, transcription_service, caplog):
+        """Test binary frames are parsed and invalid JSON is logged"""
+        callback = Mock()
+        transcription_service.transcription_callback = callback
+        
+        transcription_service._on_message(None, b'{"lines": [{"text": "From bytes"}]}')
+        callback.assert_called_once_with("From bytes", True)
+        
+        transcription_service._on_message(None, "invalid json{")
+        assert "Invalid JSON message" in caplog.text
+        assert callback.call_count == 1
+
+    def test_on_message_frame_logging_is_debug_only(self, transcription_service, caplog):
+        """Test per-frame messages are only logged at debug level"""
+        transcription_service.transcription_callback = Mock()
+        message = '{"buffer_transcription": "Hello", "lines": [{"text": "Hi"}]}'
+
+        with caplog.at_level("INFO", logger="whisper_transcriber.transcriber"):
+            transcription_service._on_message(None, message)
+        assert "Received WebSocket message" not in caplog.text
+        assert "Line transcription" not in caplog.text
+
+        transcription_service.disconnect_websocket()
+        with caplog.at_level("DEBUG", logger="whisper_transcriber.transcriber"):
+            transcription_service._on_message(None, message)
+        assert "Received WebSocket message" in caplog.text
+        assert "Line transcription: Hi" in caplog.text
+
+    def test_on_message_skips_repeated_frames_before_parsing(self, transcription_service):
+        """Test an identical consecutive frame is not parsed again"""
+        transcription_service.transcription_callback = Mock()
+        frame = '{"buffer_transcription": "Hello"}'
+
+        with patch('whisper_transcriber.transcriber.orjson.loads', wraps=orjson.loads) as mock_loads:
+            transcription_service._on_message(None, frame)
+            transcription_service._on_message(None, frame)
+            assert mock_loads.call_count == 1
+
+            # The next session starts without a previous frame
+            transcription_service.disconnect_websocket()
+            transcription_service._on_message(None, frame)
+            assert mock_loads.call_count == 2
+
+    def test_on_message_status_frames_skip_text_tracking(self, transcription_service):
+        """Test status-only frames return before touching buffer tracking"""
+        callback = Mock()
+        transcription_service.transcription_callback = callback
+        transcription_service._last_meaningful_transcription_time = 1.0
+        transcription_service._last_buffer_text = "Hello"
+
+        with patch('whisper_transcriber.transcriber.time.time') as mock_time:
+            transcription_service._on_message(
+                None, '{"status": "no_audio_detected", "buffer_transcription": ""}'
+            )
+            mock_time.assert_not_called()
+
+        assert transcription_service._last_buffer_text == "Hello"
+        assert transcription_service._last_meaningful_transcription_time == 1.0
+        callback.assert_not_called()
+
     @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
     def test_websocket_on_error(self, mock_websocket_app, transcription_service):
         """Test WebSocket error handling"""
@@ -338,6 +714,58 @@ class TestTranscriptionService:
                 mock_start.assert_called_once()
                 assert result is True
     
+    def test_restart_server_skips_unchanged_config(self, transcription_service, server_config):
+        """Test restart is skipped when a running server already uses the config"""
+        with patch.object(transcription_service, 'is_server_running', return_value=True):
+            with patch.object(transcription_service, 'stop_server') as mock_stop:
+                with patch.object(transcription_service, 'start_server') as mock_start:
+                    same_config = replace(server_config)
+                    assert transcription_service.restart_server(same_config) is True
+                    mock_stop.assert_not_called()
+                    mock_start.assert_not_called()
+                    
+                    mock_start.return_value = True
+                    new_config = ServerConfig(model="base.en")
+                    with patch('whisper_transcriber.transcriber.time.sleep'):
+                        assert transcription_service.restart_server(new_config) is True
+                    mock_stop.assert_called_once()
+                    assert transcription_service.server_config == new_config
+                    assert "base.en" in transcription_service._server_cmd
+    
+    @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
+    def test_connect_websocket_reuses_open_connection(self, mock_websocket_app, transcription_service):
+        """Test a pre-warmed connection is reused instead of reconnecting"""
+        transcription_service.transcription_callback = Mock()
+        transcription_service.websocket_client = MagicMock()
+        transcription_service.is_connected = True
+        
+        assert transcription_service.connect_websocket() is True
+        mock_websocket_app.assert_not_called()
+    
+    def test_prewarm_connects_when_port_ready(self, transcription_service):
+        """Test pre-warm connects once the server port is listening"""
+        with patch.object(transcription_service, '_wait_for_port', return_value=True):
+            with patch.object(transcription_service, 'connect_websocket') as mock_connect:
+                transcription_service._prewarm_websocket()
+                mock_connect.assert_called_once()
+        
+        with patch.object(transcription_service, '_wait_for_port', return_value=False):
+            with patch.object(transcription_service, 'connect_websocket') as mock_connect:
+                transcription_service._prewarm_websocket()
+                mock_connect.assert_not_called()
+    
+    def test_new_buffer_suffix_uses_anchor(self, transcription_service):
+        """Test buffer extension checks only compare the trailing anchor"""
+        transcription_service.BUFFER_ANCHOR_CHARS = 4
+        transcription_service._last_buffer_text = "Hello world"
+        
+        assert transcription_service._new_buffer_suffix("Hello world again") == " again"
+        assert transcription_service._new_buffer_suffix("Hello there again") is None
+        assert transcription_service._new_buffer_suffix("Hello") is None
+        
+        transcription_service._last_buffer_text = ""
+        assert transcription_service._new_buffer_suffix("Fresh") == "Fresh"
+    
     @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
     def test_incremental_buffer_transcription(self, mock_websocket_app, transcription_service):
         """Test that incremental buffer transcriptions only send new text"""
@@ -406,6 +834,19 @@ class TestTranscriptionService:
         assert calls[1][0][0] == "Second line"
         assert calls[2][0][0] == "Third line"
     
+    def test_sent_text_history_is_bounded(self, transcription_service):
+        """Test duplicate suppression only remembers recent lines"""
+        transcription_service.SENT_TEXT_HISTORY = 2
+        
+        assert transcription_service._remember_sent("one") is True
+        assert transcription_service._remember_sent("one") is False
+        assert transcription_service._remember_sent("two") is True
+        assert transcription_service._remember_sent("three") is True
+        
+        # Oldest entry was evicted
+        assert len(transcription_service._sent_hashes) == 2
+        assert transcription_service._remember_sent("one") is True
+    
     @patch('whisper_transcriber.transcriber.websocket.WebSocketApp')
     def test_transcription_state_reset_on_disconnect(self, mock_websocket_app, transcription_service):
         """Test that transcription tracking state is reset when disconnecting"""
@@ -415,12 +856,13 @@ class TestTranscriptionService:
         transcription_service.websocket_client = mock_websocket_app.return_value
         
         # Simulate some transcription activity to populate tracking variables
-        transcription_service._sent_texts = {"test1", "test2"}
+        transcription_service._remember_sent("test1")
+        transcription_service._remember_sent("test2")
         transcription_service._last_buffer_text = "Some buffer text"
         
         # Disconnect
         transcription_service.disconnect_websocket()
         
         # Verify tracking state was reset
-        assert len(transcription_service._sent_texts) == 0
+        assert len(transcription_service._sent_hashes) == 0
         assert transcription_service._last_buffer_text == ""
\ No newline at end of file
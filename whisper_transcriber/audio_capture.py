@@ -1,6 +1,7 @@
 import logging
 import threading
-from typing import Callable, List, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import sounddevice as sd
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 class AudioCapture:
     """Handles audio input and streaming"""
 
+    # Seconds a device enumeration is reused before querying PortAudio again
+    DEVICE_CACHE_TTL = 2.0
+
     def __init__(self, device_id: Optional[int] = None):
         """Initialize AudioCapture with optional device ID
 
@@ -22,19 +26,60 @@ class AudioCapture:
         """
         self.device_id = device_id
         self.stream = None
-        self.is_recording = False
         self.audio_callback = None
+        # Set while recording; read lock-free from the audio thread
+        self._recording = threading.Event()
+        # Serializes start/stop so only one stream is ever opened
         self._lock = threading.Lock()
 
         # Audio configuration matching WhisperLiveKit requirements
         self._audio_config = AudioConfig()
 
+        # (timestamp, devices, devices by id) from the last PortAudio query
+        self._devices_cache: Optional[
+            Tuple[float, List[AudioDevice], Dict[int, AudioDevice]]
+        ] = None
+
+        # Debug logging state for the audio callback
+        self._audio_log_counter = 0
+        self._abs_scratch: Optional[np.ndarray] = None
+
+        # Coalesce several callbacks into one forwarded chunk (0 = no batching)
+        self._batch_buf = bytearray()
+        if self._audio_config.batch_chunks > 1:
+            self._batch_target_bytes = (
+                self._audio_config.chunk_size
+                * self._audio_config.channels
+                * np.dtype(self._audio_config.format).itemsize
+                * self._audio_config.batch_chunks
+            )
+        else:
+            self._batch_target_bytes = 0
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether audio capture is currently active"""
+        return self._recording.is_set()
+
     def list_devices(self) -> List[AudioDevice]:
         """Get available audio input devices
 
         Returns:
             List of AudioDevice objects
         """
+        devices, _ = self._get_device_cache()
+        return list(devices)
+
+    def _get_device_cache(self) -> Tuple[List[AudioDevice], Dict[int, AudioDevice]]:
+        """Get input devices, querying PortAudio only when the cache is stale
+
+        Returns:
+            Tuple of the device list and a mapping of device ID to device
+        """
+        cache = self._devices_cache
+        if cache is not None and time.monotonic() - cache[0] < self.DEVICE_CACHE_TTL:
+            return cache[1], cache[2]
+
         devices = []
         all_devices = sd.query_devices()
         default_input = sd.default.device[0] if sd.default.device else None
@@ -52,39 +97,46 @@ class AudioCapture:
                     )
                 )
 
-        return devices
+        devices_by_id = {device.id: device for device in devices}
+        self._devices_cache = (time.monotonic(), devices, devices_by_id)
+        return devices, devices_by_id
 
-    def start_recording(self, callback: Callable[[bytes], None]) -> bool:
+    def start_recording(
+        self, callback: Callable[[Union[bytes, memoryview]], None]
+    ) -> bool:
         """Begin audio capture with callback for chunks
 
         Args:
-            callback: Function to call with audio data chunks
+            callback: Function to call with audio data chunks (bytes or a
+                memoryview that is only valid for the duration of the call)
 
         Returns:
             True if recording started successfully, False otherwise
         """
         with self._lock:
-            if self.is_recording:
+            if self._recording.is_set():
                 logger.warning("Already recording")
                 return False
 
             try:
                 self.audio_callback = callback
-                self.stream = sd.InputStream(
+                # Raw stream hands the callback a plain buffer, no numpy wrapper
+                self.stream = sd.RawInputStream(
                     device=self.device_id,
                     channels=self._audio_config.channels,
                     samplerate=self._audio_config.sample_rate,
                     blocksize=self._audio_config.chunk_size,
                     dtype=self._audio_config.format,
-                    callback=self._audio_callback,
+                    callback=self._raw_audio_callback,
                 )
+                self._recording.set()
                 self.stream.start()
-                self.is_recording = True
                 logger.info(f"Started recording on device {self.device_id}")
                 return True
 
             except Exception as e:
                 logger.error(f"Failed to start recording: {e}")
+                self._recording.clear()
                 self.stream = None
                 self.audio_callback = None
                 return False
@@ -92,10 +144,12 @@ class AudioCapture:
     def stop_recording(self) -> None:
         """Stop audio capture and cleanup"""
         with self._lock:
-            if not self.is_recording:
+            if not self._recording.is_set():
                 return
 
-            self.is_recording = False
+            # Clear first so the audio thread stops forwarding; stream.stop()
+            # then waits for any in-flight callback to finish
+            self._recording.clear()
 
             if self.stream:
                 try:
@@ -106,14 +160,24 @@ class AudioCapture:
                 finally:
                     self.stream = None
 
+            # Forward any partially filled batch before dropping the callback
+            if self._batch_buf:
+                residual = bytes(self._batch_buf)
+                self._batch_buf.clear()
+                if self.audio_callback:
+                    try:
+                        self.audio_callback(residual)
+                    except Exception as e:
+                        logger.error(f"Error in audio callback: {e}")
+
             self.audio_callback = None
             logger.info("Stopped recording")
 
-    def _audio_callback(self, indata: np.ndarray, frames: int, time, status) -> None:
-        """Internal callback processing audio chunks
+    def _raw_audio_callback(self, indata, frames: int, time, status) -> None:
+        """Internal callback processing raw audio chunks
 
         Args:
-            indata: Audio data as numpy array
+            indata: Raw PCM audio buffer (supports the buffer protocol)
             frames: Number of frames
             time: Timing information
             status: Status flags
@@ -121,19 +185,33 @@ class AudioCapture:
         if status:
             logger.warning(f"Audio callback error: {status}")
 
-        if self.is_recording and self.audio_callback:
-            # Convert numpy array to bytes
-            audio_bytes = indata.tobytes()
-            # Log only occasionally to avoid spam
-            if hasattr(self, "_audio_log_counter"):
-                self._audio_log_counter += 1
+        if self._recording.is_set() and self.audio_callback:
+            if self._batch_target_bytes:
+                self._batch_buf += indata
+                if len(self._batch_buf) < self._batch_target_bytes:
+                    return
+                audio_bytes = bytes(self._batch_buf)
+                self._batch_buf.clear()
             else:
-                self._audio_log_counter = 0
-
-            if self._audio_log_counter % 100 == 0:  # Log every 100th chunk
+                # Zero-copy view; only valid until this callback returns, so
+                # consumers that keep the data must copy it
+                audio_bytes = memoryview(indata).cast("B")
+            # Log only occasionally to avoid spam, and only scan the buffer
+            # for amplitude when debug logging is actually enabled
+            if self._audio_log_counter % 100 == 0 and logger.isEnabledFor(
+                logging.DEBUG
+            ):
+                samples = np.frombuffer(audio_bytes, dtype=self._audio_config.format)
+                if (
+                    self._abs_scratch is None
+                    or self._abs_scratch.shape != samples.shape
+                ):
+                    self._abs_scratch = np.empty_like(samples)
+                amplitude = np.abs(samples, out=self._abs_scratch).max()
                 logger.debug(
-                    f"Audio captured: {len(audio_bytes)} bytes, max amplitude: {np.max(np.abs(indata))}"
+                    f"Audio captured: {len(audio_bytes)} bytes, max amplitude: {amplitude}"
                 )
+            self._audio_log_counter += 1
 
             try:
                 self.audio_callback(audio_bytes)
@@ -146,13 +224,11 @@ class AudioCapture:
         Returns:
             AudioDevice object or None if using default
         """
-        devices = self.list_devices()
+        devices, devices_by_id = self._get_device_cache()
 
         if self.device_id is not None:
             # Find specific device
-            for device in devices:
-                if device.id == self.device_id:
-                    return device
+            return devices_by_id.get(self.device_id)
         else:
             # Return default device
             for device in devices:
@@ -170,10 +246,11 @@ class AudioCapture:
         Raises:
             RuntimeError: If called while recording
         """
-        if self.is_recording:
+        if self._recording.is_set():
             raise RuntimeError("Cannot change device while recording")
 
         self.device_id = device_id
+        self._devices_cache = None
 
     def get_audio_config(self) -> AudioConfig:
         """Get current audio configuration
@@ -1,7 +1,26 @@
-import json
+import os
 import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+import orjson
+
+
+# Required configuration keys and their accepted types
+_REQUIRED_TYPES: Tuple[Tuple[str, Union[Type, Tuple[Type, ...]]], ...] = (
+    ("hotkey", str),
+    ("audio_device", str),
+    ("audio_device_id", (int, type(None))),
+    ("insertion_method", str),
+    ("model", str),
+    ("language", str),
+    ("start_at_login", bool),
+    ("vad_enabled", bool),
+    ("use_gpu", bool),
+)
+
+# Sentinel distinguishing a missing key from a None value
+_MISSING = object()
 
 
 class ConfigManager:
@@ -19,6 +38,9 @@ class ConfigManager:
         "use_gpu": False,
     }
 
+    # Delay before a save() is written to disk; later saves restart the timer
+    SAVE_DEBOUNCE_SECONDS = 0.25
+
     def __init__(self, config_path: str = "~/.whisper-transcriber/config.json"):
         """Initialize ConfigManager with config file path
 
@@ -27,8 +49,62 @@ class ConfigManager:
         """
         self.config_path = Path(config_path).expanduser()
         self._lock = threading.Lock()
+        # Dotted-key index for nested keys, None until get() rebuilds it
+        self._flat: Optional[Dict[str, Any]] = None
+        self._save_timer: Optional[threading.Timer] = None
         self.config = self._load_config()
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current configuration dictionary
+
+        The caller may change the returned dict in place, so the dotted-key
+        index is dropped and rebuilt on the next nested get().
+        """
+        self._flat = None
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._flat = None
+
+    def _flat_index(self) -> Dict[str, Any]:
+        """Get the dotted-key index used by get() for nested keys
+
+        Returns:
+            Mapping of dotted keys to values, rebuilt if it was dropped
+        """
+        flat = self._flat
+        if flat is not None:
+            return flat
+
+        with self._lock:
+            flat = self._build_flat()
+            self._flat = flat
+        return flat
+
+    def _build_flat(self) -> Dict[str, Any]:
+        """Build the dotted-key index from the current configuration
+
+        Returns:
+            Mapping of dotted keys to values
+        """
+        flat: Dict[str, Any] = {}
+
+        def walk(prefix: str, node: Dict[str, Any]) -> None:
+            for key, value in node.items():
+                dotted = f"{prefix}.{key}"
+                flat[dotted] = value
+                if isinstance(value, dict):
+                    walk(dotted, value)
+
+        for key, value in self._config.items():
+            if isinstance(value, dict):
+                walk(key, value)
+
+        return flat
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from disk
 
@@ -36,18 +112,21 @@ class ConfigManager:
             Configuration dictionary
         """
         if self.config_path.exists():
-            try:
-                with open(self.config_path, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # If file is corrupted, use default config
-                return self.DEFAULT_CONFIG.copy()
+            # Fall back to a leftover temp file from an interrupted save
+            for path in (self.config_path, self._temp_path):
+                try:
+                    with open(path, "rb") as f:
+                        return orjson.loads(f.read())
+                except (orjson.JSONDecodeError, IOError):
+                    continue
+            # If file is corrupted, use default config
+            return self.DEFAULT_CONFIG.copy()
         else:
             # Create config file with defaults
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             default_config = self.DEFAULT_CONFIG.copy()
-            with open(self.config_path, "w") as f:
-                json.dump(default_config, f, indent=2)
+            with open(self.config_path, "wb") as f:
+                f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
             return default_config
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -60,17 +139,10 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        # Handle nested keys with dot notation
+        # Nested keys are served from the dotted-key index
         if "." in key:
-            keys = key.split(".")
-            value = self.config
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            return value
-        return self.config.get(key, default)
+            return self._flat_index().get(key, default)
+        return self._config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value
@@ -83,21 +155,60 @@ class ConfigManager:
             # Handle nested keys with dot notation
             if "." in key:
                 keys = key.split(".")
-                config = self.config
+                config = self._config
                 for k in keys[:-1]:
                     if k not in config or not isinstance(config[k], dict):
                         config[k] = {}
                     config = config[k]
                 config[keys[-1]] = value
+                self._flat = None
             else:
-                self.config[key] = value
+                previous = self._config.get(key)
+                self._config[key] = value
+                # Only nested dicts contribute to the dotted-key index
+                if isinstance(value, dict) or isinstance(previous, dict):
+                    self._flat = None
+
+    @property
+    def _temp_path(self) -> Path:
+        """Temporary file written before atomically replacing the config"""
+        return self.config_path.with_suffix(".json.tmp")
 
     def save(self) -> None:
-        """Persist configuration to disk"""
+        """Schedule the configuration to be persisted to disk
+
+        Saves are debounced: repeated calls within SAVE_DEBOUNCE_SECONDS
+        result in a single write. Use flush() to write immediately.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(
+                self.SAVE_DEBOUNCE_SECONDS, self._flush_to_disk
+            )
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write any pending save to disk immediately"""
         with self._lock:
+            timer = self._save_timer
+            if timer is None:
+                return
+            timer.cancel()
+        self._flush_to_disk()
+
+    def _flush_to_disk(self) -> None:
+        """Atomically write configuration to disk via a temp file"""
+        with self._lock:
+            self._save_timer = None
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w") as f:
-                json.dump(self.config, f, indent=2)
+            temp_path = self._temp_path
+            with open(temp_path, "wb") as f:
+                f.write(orjson.dumps(self._config, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_path)
 
     def validate(self) -> bool:
         """Validate current configuration
@@ -105,26 +216,11 @@ class ConfigManager:
         Returns:
             True if configuration is valid, False otherwise
         """
-        # Check all required keys are present
-        for key in self.DEFAULT_CONFIG:
-            if key not in self.config:
-                return False
-
-        # Type validation
-        type_checks = {
-            "hotkey": str,
-            "audio_device": str,
-            "audio_device_id": (int, type(None)),
-            "insertion_method": str,
-            "model": str,
-            "language": str,
-            "start_at_login": bool,
-            "vad_enabled": bool,
-            "use_gpu": bool,
-        }
-
-        for key, expected_type in type_checks.items():
-            if key in self.config and not isinstance(self.config[key], expected_type):
+        # Required keys must be present and of the expected type
+        config = self._config
+        for key, expected_type in _REQUIRED_TYPES:
+            value = config.get(key, _MISSING)
+            if value is _MISSING or not isinstance(value, expected_type):
                 return False
 
         return True
@@ -141,7 +237,8 @@ class ConfigManager:
             new_config: Configuration dictionary to merge
         """
         with self._lock:
-            self.config.update(new_config)
+            self._config.update(new_config)
+            self._flat = None
 
     def export(self) -> str:
         """Export configuration as JSON string
@@ -149,7 +246,7 @@ class ConfigManager:
         Returns:
             JSON string of configuration
         """
-        return json.dumps(self.config, indent=2)
+        return orjson.dumps(self._config, option=orjson.OPT_INDENT_2).decode()
 
     def import_config(self, config_json: str) -> None:
         """Import configuration from JSON string
@@ -161,8 +258,8 @@ class ConfigManager:
             ValueError: If JSON is invalid
         """
         try:
-            new_config = json.loads(config_json)
+            new_config = orjson.loads(config_json)
             with self._lock:
                 self.config = new_config
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON configuration: {e}")
@@ -1,12 +1,51 @@
+import functools
 import logging
+import sys
 import threading
-from typing import Callable, Dict, List, Optional
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional
 
 from pynput import keyboard
 
 
 logger = logging.getLogger(__name__)
 
+# Modifier name to pynput token mappings
+_MODIFIERS = {
+    "cmd": "<cmd>",
+    "command": "<cmd>",
+    "win": "<cmd>",  # Windows key
+    "ctrl": "<ctrl>",
+    "control": "<ctrl>",
+    "alt": "<alt>",
+    "option": "<alt>",  # macOS option
+    "opt": "<alt>",
+    "shift": "<shift>",
+}
+
+# Special key name to pynput token mappings
+_SPECIAL_KEYS = {
+    "space": "<space>",
+    "spacebar": "<space>",
+    "enter": "<enter>",
+    "return": "<enter>",
+    "tab": "<tab>",
+    "esc": "<esc>",
+    "escape": "<esc>",
+    "backspace": "<backspace>",
+    "delete": "<delete>",
+    "up": "<up>",
+    "down": "<down>",
+    "left": "<left>",
+    "right": "<right>",
+}
+
+# Merged, interned token lookup used by the parser
+_KEY_MAP = {
+    sys.intern(name): sys.intern(token)
+    for name, token in {**_MODIFIERS, **_SPECIAL_KEYS}.items()
+}
+
 
 class HotkeyError(Exception):
     """Exception raised for hotkey-related errors"""
@@ -17,12 +56,30 @@ class HotkeyError(Exception):
 class HotkeyManager:
     """Manages global keyboard shortcuts"""
 
+    # Delay before rebuilding the listener; further changes restart the timer
+    RESTART_DEBOUNCE_SECONDS = 0.05
+
+    # Minimum seconds between logged errors from the same callback
+    CALLBACK_ERROR_LOG_INTERVAL = 1.0
+
     def __init__(self):
         """Initialize HotkeyManager"""
         self.hotkeys: Dict[str, Callable] = {}
+        # Immutable snapshot of registered combinations, republished after
+        # every change so readers never need the lock
+        self._hotkeys_view: FrozenSet[str] = frozenset()
         self.listener: Optional[keyboard.GlobalHotKeys] = None
         self._is_listening = False
+        # Guards hotkeys, _pynput_map and the listening/rebuild state
         self._lock = threading.Lock()
+        # Serializes listener start/stop/rebuild; _lock is never held while
+        # a listener is being stopped or started
+        self._listener_lock = threading.Lock()
+        # Parsed pynput hotkey -> wrapped callback, kept in sync with hotkeys
+        self._pynput_map: Dict[str, Callable] = {}
+        # Pending listener rebuild after hotkey changes
+        self._dirty = False
+        self._restart_timer: Optional[threading.Timer] = None
 
     def register_hotkey(self, combination: str, callback: Callable) -> None:
         """Register a global hotkey
@@ -43,11 +100,15 @@ class HotkeyManager:
                 raise HotkeyError(f"Hotkey '{combination}' is already registered")
 
             self.hotkeys[combination] = callback
+            self._pynput_map[self._parse_hotkey(combination)] = self._wrap_callback(
+                callback
+            )
+            self._hotkeys_view = frozenset(self.hotkeys)
             logger.info(f"Registered hotkey: {combination}")
 
             # Restart listener if already running
             if self._is_listening:
-                self._restart_listener()
+                self._schedule_restart()
 
     def unregister_hotkey(self, combination: str) -> None:
         """Remove a hotkey registration
@@ -58,127 +119,142 @@ class HotkeyManager:
         with self._lock:
             if combination in self.hotkeys:
                 del self.hotkeys[combination]
+                self._hotkeys_view = frozenset(self.hotkeys)
+                parsed_key = self._parse_hotkey(combination)
+                del self._pynput_map[parsed_key]
+                # Another spelling of the same keys (e.g. "command+a" for
+                # "cmd+a") may still be registered
+                for other, callback in self.hotkeys.items():
+                    if self._parse_hotkey(other) == parsed_key:
+                        self._pynput_map[parsed_key] = self._wrap_callback(callback)
                 logger.info(f"Unregistered hotkey: {combination}")
 
                 # Restart listener if running
                 if self._is_listening:
-                    self._restart_listener()
+                    self._schedule_restart()
 
     def start_listening(self) -> None:
         """Begin monitoring for hotkey events"""
-        with self._lock:
-            if self._is_listening:
-                logger.warning("Hotkey listener already running")
-                return
+        with self._listener_lock:
+            with self._lock:
+                if self._is_listening:
+                    logger.warning("Hotkey listener already running")
+                    return
 
-            if not self.hotkeys:
-                logger.warning("No hotkeys registered")
-                return
+                if not self.hotkeys:
+                    logger.warning("No hotkeys registered")
+                    return
 
-            # Convert hotkeys to pynput format
-            pynput_hotkeys = {}
-            for combination, callback in self.hotkeys.items():
-                parsed_key = self._parse_hotkey(combination)
-                # Wrap callback to handle errors
-                pynput_hotkeys[parsed_key] = self._wrap_callback(callback)
+                # Claim the listening state now so changes made while the
+                # listener starts schedule a rebuild
+                self._is_listening = True
+                hotkeys = dict(self._pynput_map)
+
+            try:
+                self._build_and_start_listener(hotkeys)
+            except Exception:
+                with self._lock:
+                    self._is_listening = False
+                raise
 
-            # Create and start listener
-            self.listener = keyboard.GlobalHotKeys(pynput_hotkeys)
-            self.listener.start()
-            self._is_listening = True
             logger.info("Started hotkey listener")
 
     def stop_listening(self) -> None:
         """Stop monitoring for hotkey events"""
-        with self._lock:
-            if not self._is_listening:
-                return
+        with self._listener_lock:
+            with self._lock:
+                if not self._is_listening:
+                    return
 
-            if self.listener:
-                self.listener.stop()
+                self._cancel_restart()
+                listener = self.listener
                 self.listener = None
+                self._is_listening = False
 
-            self._is_listening = False
+            # Stopped without holding _lock so hotkey callbacks that touch
+            # the manager cannot deadlock against us
+            if listener:
+                listener.stop()
             logger.info("Stopped hotkey listener")
 
-    def _restart_listener(self) -> None:
-        """Restart the listener (called when hotkeys change)"""
-        # Stop the old listener first (without lock to avoid deadlock)
-        old_listener = self.listener
-        self.listener = None
-        self._is_listening = False
+    def _schedule_restart(self) -> None:
+        """Mark the listener dirty and (re)arm the debounced rebuild
 
-        # Release lock before stopping to avoid deadlock
-        if old_listener:
-            try:
-                old_listener.stop()
-            except Exception as e:
-                logger.error(f"Error stopping listener: {e}")
+        Must be called with the lock held. Several changes in quick
+        succession result in a single listener restart.
+        """
+        self._dirty = True
+        if self._restart_timer is not None:
+            self._restart_timer.cancel()
+        self._restart_timer = threading.Timer(
+            self.RESTART_DEBOUNCE_SECONDS, self._apply_pending
+        )
+        self._restart_timer.daemon = True
+        self._restart_timer.start()
+
+    def _cancel_restart(self) -> None:
+        """Drop any pending rebuild (must be called with the lock held)"""
+        self._dirty = False
+        if self._restart_timer is not None:
+            self._restart_timer.cancel()
+            self._restart_timer = None
+
+    def _apply_pending(self) -> None:
+        """Restart the listener once for all changes since the last rebuild
+
+        The hotkey state is snapshotted under _lock; the listener is swapped
+        under _listener_lock only, so callbacks may register or unregister
+        hotkeys while this runs.
+        """
+        with self._listener_lock:
+            with self._lock:
+                if not self._dirty or not self._is_listening:
+                    return
+                self._dirty = False
+                hotkeys = dict(self._pynput_map)
+                old_listener = self.listener
+
+            if old_listener:
+                try:
+                    old_listener.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping listener: {e}")
 
-        # Now start new listener
-        # Create new hotkeys dict
-        pynput_hotkeys = {}
-        for combination, callback in self.hotkeys.items():
-            parsed_key = self._parse_hotkey(combination)
-            pynput_hotkeys[parsed_key] = self._wrap_callback(callback)
+            self._build_and_start_listener(hotkeys)
 
-        # Create and start new listener
-        self.listener = keyboard.GlobalHotKeys(pynput_hotkeys)
-        self.listener.start()
-        self._is_listening = True
+    def _build_and_start_listener(self, hotkeys: Dict[str, Callable]) -> None:
+        """Create and start a listener for a snapshot of the pynput map
 
-    def _parse_hotkey(self, combination: str) -> str:
+        Must be called with _listener_lock held.
+
+        Args:
+            hotkeys: Pynput-formatted combinations mapped to wrapped callbacks
+        """
+        listener = keyboard.GlobalHotKeys(hotkeys)
+        listener.start()
+        with self._lock:
+            self.listener = listener
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_hotkey(combination: str) -> str:
         """Parse hotkey combination to pynput format
 
+        Results are memoized since the same combinations are re-parsed on
+        every listener restart.
+
         Args:
             combination: Human-readable hotkey (e.g., "cmd+shift+r")
 
         Returns:
             Pynput-formatted hotkey (e.g., "<cmd>+<shift>+r")
         """
-        # Split combination
         parts = combination.lower().split("+")
-        parsed_parts = []
-
-        # Define modifier mappings
-        modifiers = {
-            "cmd": "<cmd>",
-            "command": "<cmd>",
-            "win": "<cmd>",  # Windows key
-            "ctrl": "<ctrl>",
-            "control": "<ctrl>",
-            "alt": "<alt>",
-            "option": "<alt>",  # macOS option
-            "opt": "<alt>",
-            "shift": "<shift>",
-        }
-
-        # Define special key mappings
-        special_keys = {
-            "space": "<space>",
-            "spacebar": "<space>",
-            "enter": "<enter>",
-            "return": "<enter>",
-            "tab": "<tab>",
-            "esc": "<esc>",
-            "escape": "<esc>",
-            "backspace": "<backspace>",
-            "delete": "<delete>",
-            "up": "<up>",
-            "down": "<down>",
-            "left": "<left>",
-            "right": "<right>",
-        }
-
-        for part in parts:
-            part = part.strip()
-            if part in modifiers:
-                parsed_parts.append(modifiers[part])
-            elif part in special_keys:
-                parsed_parts.append(special_keys[part])
-            else:
-                # Regular key
-                parsed_parts.append(part)
+        # Only pay for stripping when the combination contains spaces
+        if " " in combination:
+            parts = [part.strip() for part in parts]
+        # Modifiers and special keys map to tokens; regular keys pass through
+        parsed_parts = [_KEY_MAP.get(part, part) for part in parts]
 
         return "+".join(parsed_parts)
 
@@ -189,14 +265,32 @@ class HotkeyManager:
             callback: Original callback function
 
         Returns:
-            Wrapped callback that handles errors
+            Wrapped callback that handles errors. Repeated errors are logged
+            at most once per CALLBACK_ERROR_LOG_INTERVAL, with a count of the
+            ones suppressed in between.
         """
+        interval = self.CALLBACK_ERROR_LOG_INTERVAL
+        last_logged = float("-inf")
+        suppressed = 0
 
         def wrapped():
+            nonlocal last_logged, suppressed
             try:
                 callback()
             except Exception as e:
-                logger.error(f"Error in hotkey callback: {e}")
+                now = time.monotonic()
+                if now - last_logged < interval:
+                    suppressed += 1
+                    return
+                if suppressed:
+                    logger.error(
+                        f"Error in hotkey callback: {e} "
+                        f"({suppressed} similar errors suppressed)"
+                    )
+                else:
+                    logger.error(f"Error in hotkey callback: {e}")
+                last_logged = now
+                suppressed = 0
 
         return wrapped
 
@@ -206,8 +300,7 @@ class HotkeyManager:
         Returns:
             List of hotkey combination strings
         """
-        with self._lock:
-            return list(self.hotkeys.keys())
+        return list(self._hotkeys_view)
 
     def is_hotkey_registered(self, combination: str) -> bool:
         """Check if a hotkey is registered
@@ -218,15 +311,15 @@ class HotkeyManager:
         Returns:
             True if hotkey is registered, False otherwise
         """
-        with self._lock:
-            return combination in self.hotkeys
+        return combination in self._hotkeys_view
 
     def clear_all_hotkeys(self) -> None:
         """Remove all registered hotkeys"""
         with self._lock:
             self.hotkeys.clear()
+            self._pynput_map.clear()
+            self._hotkeys_view = frozenset()
             logger.info("Cleared all hotkeys")
 
-            # Stop listener if running
-            if self._is_listening:
-                self.stop_listening()
+        # Stop listener if running (takes the locks itself)
+        self.stop_listening()
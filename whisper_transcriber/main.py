@@ -1,7 +1,13 @@
+import atexit
+import functools
 import logging
 import os
+import queue
 import sys
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Union
 
 import rumps
 
@@ -17,20 +23,35 @@ from .startup_manager import StartupManager
 from .preferences_simple import SimplePreferencesWindow
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Configure logging. Records are queued and written by a listener thread so
+# the audio, WebSocket and UI threads never contend on handler locks
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_listener = QueueListener(_log_queue, _log_output)
+# Debug output is opt-in via WHISPER_DEBUG
+_log_level = logging.DEBUG if os.getenv("WHISPER_DEBUG") else logging.INFO
+logging.basicConfig(level=_log_level, handlers=[QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
-# Set specific loggers to appropriate levels
-logging.getLogger("whisper_transcriber.transcriber").setLevel(logging.DEBUG)
-logging.getLogger("whisper_transcriber.text_inserter").setLevel(logging.DEBUG)
-logging.getLogger("whisper_transcriber.audio_capture").setLevel(logging.DEBUG)
 
 
 # Notifications removed - not working on modern macOS
 
 
+def _is_gil_enabled() -> bool:
+    """Check whether the GIL is active
+
+    Returns:
+        False only on a free-threaded build running with the GIL disabled
+    """
+    # sys._is_gil_enabled only exists on Python 3.13+
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
 class WhisperTranscriberApp(rumps.App):
     """Main application class managing menu bar presence"""
 
@@ -78,6 +99,10 @@ class WhisperTranscriberApp(rumps.App):
 
         # State
         self.is_recording = False
+        # Final transcription text already inserted in this recording
+        self._inserted_text = ""
+        # Insertion method resolved once per recording (None = resolve again)
+        self._current_insert_method: Optional[InsertMethod] = None
 
         # Setup menu
         self._setup_menu()
@@ -87,21 +112,22 @@ class WhisperTranscriberApp(rumps.App):
         self.hotkey_manager.register_hotkey(hotkey, self.toggle_recording_hotkey)
         self.hotkey_manager.start_listening()
 
-        # Start the transcription server immediately for faster recording
+        # Start the transcription server in the background so the menu bar
+        # appears immediately; recording is refused until it has started
         logger.info("Starting WhisperLiveKit server in background...")
-        if not self.transcription_service.start_server():
-            logger.warning(
-                "Failed to start server on launch - will retry on first recording"
-            )
-        else:
-            logger.info("WhisperLiveKit server ready")
+        self._start_server_warmup()
 
-        logger.info("WhisperTranscriber initialized")
+        gil_state = "enabled" if _is_gil_enabled() else "disabled"
+        logger.info(f"WhisperTranscriber initialized (GIL {gil_state})")
 
     def _setup_menu(self):
         """Set up the menu items"""
+        # Kept so the title can be toggled without searching the menu
+        self._record_menu_item = rumps.MenuItem(
+            "Start Recording", callback=self.toggle_recording
+        )
         self.menu = [
-            rumps.MenuItem("Start Recording", callback=self.toggle_recording),
+            self._record_menu_item,
             rumps.separator,
             rumps.MenuItem("Preferences...", callback=self.show_preferences),
             rumps.MenuItem("About", callback=self.show_about),
@@ -109,27 +135,74 @@ class WhisperTranscriberApp(rumps.App):
             rumps.MenuItem("Quit", callback=self.quit_application),
         ]
 
+    def _start_server_warmup(self, requested: bool = False) -> None:
+        """Start the transcription server on a background thread
+
+        Args:
+            requested: Whether the user asked to record, so a failure is
+                reported to them
+        """
+        self._server_warmup = threading.Thread(
+            target=self._warm_up_server,
+            args=(requested,),
+            name="server-warmup",
+            daemon=True,
+        )
+        self._server_warmup.start()
+
+    def _warm_up_server(self, requested: bool = False):
+        """Start the transcription server (runs on the warmup thread)
+
+        Args:
+            requested: Whether the user asked to record, so a failure is
+                reported to them
+        """
+        if self.transcription_service.start_server():
+            logger.info("WhisperLiveKit server ready")
+        elif requested:
+            logger.error(
+                "Failed to start transcription server. Check if whisperlive-server is installed."
+            )
+            rumps.notification(
+                title="Server Error",
+                subtitle="Could not start WhisperLiveKit server",
+                message="Please ensure whisperlive-server is installed. "
+                "Check the logs for more details.",
+            )
+        else:
+            logger.warning(
+                "Failed to start server on launch - will retry on first recording"
+            )
+
+    def _notify_server_starting(self) -> None:
+        """Tell the user recording can start once the server is up"""
+        logger.info("Server is still starting, recording not started")
+        rumps.notification(
+            title="Starting...",
+            subtitle="The transcription server is still starting",
+            message="Try again in a moment.",
+        )
+
     def toggle_recording(self, sender):
         """Start/stop recording with icon change"""
         if not self.is_recording:
             # Start recording
             logger.info("Starting recording...")
+            self._current_insert_method = None
+
+            # This runs on the menu or hotkey listener thread, so never wait
+            # for the server here. A warming-up server process already counts
+            # as running while it is still loading the model.
+            if self._server_warmup.is_alive():
+                self._notify_server_starting()
+                return
 
-            # Start transcription server if not already running
+            # Start transcription server in the background if not running
             if not self.transcription_service.is_server_running():
-                logger.info("Server not running, starting now...")
-                if not self.transcription_service.start_server():
-                    logger.error(
-                        "Failed to start transcription server. Check if whisperlive-server is installed."
-                    )
-                    rumps.alert(
-                        title="Server Error",
-                        message="Could not start WhisperLiveKit server.\n\n"
-                        "Please ensure whisperlive-server is installed:\n"
-                        "pip install whisperlive\n\n"
-                        "Check the logs for more details.",
-                    )
-                    return
+                logger.info("Server not running, starting it in the background...")
+                self._notify_server_starting()
+                self._start_server_warmup(requested=True)
+                return
 
             # Connect WebSocket
             if not self.transcription_service.connect_websocket():
@@ -161,8 +234,7 @@ class WhisperTranscriberApp(rumps.App):
             # self.transcription_service.stop_server()
 
             # Reset transcription tracking
-            if hasattr(self, "_inserted_text"):
-                self._inserted_text = ""
+            self._inserted_text = ""
 
             # Update state
             self.is_recording = False
@@ -176,79 +248,113 @@ class WhisperTranscriberApp(rumps.App):
 
     def _update_menu_item(self):
         """Update the recording menu item text"""
-        # Find the Start Recording menu item
-        for item in self.menu:
-            if hasattr(item, "title"):
-                # Handle both callable and non-callable title attributes
-                try:
-                    if callable(item.title):
-                        title_str = str(item.title())
-                    else:
-                        title_str = str(item.title)
-
-                    if "Recording" in title_str:
-                        if self.is_recording:
-                            item.title = "Stop Recording"
-                        else:
-                            item.title = "Start Recording"
-                        break
-                except:
-                    pass
-
-    def _handle_audio_chunk(self, audio_data: bytes):
+        self._record_menu_item.title = (
+            "Stop Recording" if self.is_recording else "Start Recording"
+        )
+
+    def _handle_audio_chunk(self, audio_data: Union[bytes, memoryview]):
         """Handle audio data from capture"""
         self.transcription_service.send_audio_chunk(audio_data)
 
     def _handle_transcription(self, text: str, is_final: bool):
         """Handle transcription results"""
-        logger.debug(
-            f"_handle_transcription called: text='{text}', is_final={is_final}"
-        )
-
-        # Keep track of what we've already inserted to prevent duplicates
-        if not hasattr(self, "_inserted_text"):
-            self._inserted_text = ""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"_handle_transcription called: text='{text}', is_final={is_final}"
+            )
 
         if text.strip():
             # For final transcriptions, check if this is cumulative
             if is_final:
-                # Check if this text starts with what we've already inserted
-                if text.startswith(self._inserted_text) and len(text) > len(
-                    self._inserted_text
-                ):
-                    # Only insert the new part
-                    new_text = text[len(self._inserted_text) :]
+                # Only insert the part past what we've already inserted
+                new_text = self._new_final_text(text)
+                if new_text is not None:
                     if new_text.strip():
-                        method = self.config_manager.get(
-                            "insertion_method", "clipboard"
-                        )
-                        logger.info(
-                            f"Inserting new text: '{new_text}' using method: {method}"
-                        )
                         try:
-                            self.text_inserter.insert_text(
-                                new_text, InsertMethod(method)
+                            method = self._get_insert_method()
+                            logger.info(
+                                f"Inserting new text: '{new_text}' using method: {method.value}"
+                            )
+                            future = self.text_inserter.insert_text(new_text, method)
+                            future.add_done_callback(
+                                functools.partial(self._on_text_inserted, new_text)
                             )
                             self._inserted_text = text  # Update what we've inserted
-                            logger.info(f"Successfully inserted new text: {new_text}")
                         except Exception as e:
                             logger.error(f"Failed to insert text: {e}", exc_info=True)
                 elif text != self._inserted_text:
                     # Completely new text, insert it all
-                    method = self.config_manager.get("insertion_method", "clipboard")
-                    logger.info(f"Inserting text: '{text}' using method: {method}")
                     try:
-                        self.text_inserter.insert_text(text, InsertMethod(method))
+                        method = self._get_insert_method()
+                        logger.info(
+                            f"Inserting text: '{text}' using method: {method.value}"
+                        )
+                        future = self.text_inserter.insert_text(text, method)
+                        future.add_done_callback(
+                            functools.partial(self._on_text_inserted, text)
+                        )
                         self._inserted_text = text
-                        logger.info(f"Successfully inserted text: {text}")
                     except Exception as e:
                         logger.error(f"Failed to insert text: {e}", exc_info=True)
 
+    def _on_text_inserted(self, text: str, future: "Future[None]"):
+        """Log the outcome of a text insertion
+
+        Args:
+            text: Text that was submitted for insertion
+            future: Completed insertion future
+        """
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Failed to insert text: {error}", exc_info=error)
+        else:
+            logger.info(f"Successfully inserted text: {text}")
+
+    def _get_insert_method(self) -> InsertMethod:
+        """Get the configured insertion method, cached for the recording
+
+        Returns:
+            InsertMethod to use for text insertion
+
+        Raises:
+            ValueError: If the configured method is invalid
+        """
+        if self._current_insert_method is None:
+            self._current_insert_method = InsertMethod(
+                self.config_manager.get("insertion_method", "clipboard")
+            )
+        return self._current_insert_method
+
+    def _on_preferences_saved(self):
+        """Drop settings cached from the previous configuration"""
+        self._current_insert_method = None
+
+    def _new_final_text(self, text: str) -> Optional[str]:
+        """Get the part of a final transcription that was not inserted yet
+
+        The whole inserted text is compared, so a final revision that
+        changes an earlier word is never mistaken for an extension.
+
+        Args:
+            text: Final transcription text
+
+        Returns:
+            The text after the inserted prefix, or None if text does not
+            extend it
+        """
+        inserted = self._inserted_text
+        if len(text) <= len(inserted) or not text.startswith(inserted):
+            return None
+        return text[len(inserted) :]
+
     def show_preferences(self, sender):
         """Display preferences window"""
         logger.info("Opening preferences window...")
         prefs = SimplePreferencesWindow(
-            self.config_manager, self.audio_capture, self.hotkey_manager
+            self.config_manager,
+            self.audio_capture,
+            self.hotkey_manager,
+            on_save=self._on_preferences_saved,
         )
         prefs.show()
 
@@ -265,15 +371,21 @@ class WhisperTranscriberApp(rumps.App):
         """Clean shutdown of all components"""
         logger.info("Shutting down...")
 
-        # Stop recording if active
+        # Stop recording if active, and close the connection even when idle
+        # since it may be pre-warmed
         if self.is_recording:
             self.audio_capture.stop_recording()
-            self.transcription_service.disconnect_websocket()
+        self.transcription_service.disconnect_websocket()
 
         # Stop all services
         self.transcription_service.stop_server()
         self.hotkey_manager.stop_listening()
 
+        # Finish pending insertions, give back the user's clipboard and write
+        # pending settings changes
+        self.text_inserter.close()
+        self.config_manager.flush()
+
         # Quit app
         rumps.quit_application()
 
@@ -1,9 +1,14 @@
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
 
-@dataclass(frozen=True)
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class AudioConfig:
     """Audio capture configuration settings"""
 
@@ -11,9 +16,10 @@ class AudioConfig:
     channels: int = 1  # Mono
     chunk_size: int = 1600  # 100ms chunks for better performance
     format: str = "int16"  # 16-bit PCM
+    batch_chunks: int = 1  # Callbacks coalesced per forwarded chunk
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ServerConfig:
     """WhisperLiveKit server configuration"""
 
@@ -30,7 +36,7 @@ class ServerConfig:
         return f"ws://{self.host}:{self.port}/asr"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AudioDevice:
     """Represents an audio input device"""
 
@@ -1,6 +1,7 @@
 import logging
+import time
 import rumps
-from typing import Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from .config import ConfigManager
 from .audio_capture import AudioCapture
@@ -10,6 +11,120 @@ from .startup_manager import StartupManager
 
 logger = logging.getLogger(__name__)
 
+# Seconds the microphone choices are reused across dialog openings
+_DEVICE_CACHE_TTL = 5.0
+
+
+class _DeviceChoices(NamedTuple):
+    """Microphone choices shown in the preferences dialog"""
+
+    names: List[str]
+    # Description -> device ID
+    device_map: Dict[str, Optional[int]]
+    # Lowercase description -> device ID, for matching typed names
+    lookup: Dict[str, Optional[int]]
+    # Numbered device list text
+    listing: str
+
+    def find(self, text: str) -> Optional[int]:
+        """Find the device ID for a typed device number or name
+
+        Args:
+            text: 1-based number from the listing, or a full or partial
+                device description (case-insensitive)
+
+        Returns:
+            Device ID of the first match, None for the system default
+
+        Raises:
+            KeyError: If no device matches
+        """
+        if text.isdigit():
+            index = int(text) - 1
+            if 0 <= index < len(self.names):
+                return self.device_map[self.names[index]]
+            raise KeyError(text)
+
+        text = text.lower()
+        if text in self.lookup:
+            return self.lookup[text]
+        for desc, dev_id in self.lookup.items():
+            if text in desc:
+                return dev_id
+        raise KeyError(text)
+
+
+# (timestamp, choices) from the last device enumeration
+_device_cache: Optional[Tuple[float, _DeviceChoices]] = None
+
+
+def _get_device_choices(audio_capture: AudioCapture) -> _DeviceChoices:
+    """Get the microphone choices shown in the preferences dialog
+
+    Args:
+        audio_capture: Audio capture instance used to enumerate devices
+
+    Returns:
+        Device choices, reused for _DEVICE_CACHE_TTL seconds
+    """
+    global _device_cache
+    cache = _device_cache
+    if cache is not None and time.monotonic() - cache[0] < _DEVICE_CACHE_TTL:
+        return cache[1]
+
+    devices = audio_capture.list_devices()
+    device_names = ["default (System Default)"]
+    # The listed default entry and its short alias both select the default
+    device_map: Dict[str, Optional[int]] = dict.fromkeys(("default", device_names[0]))
+
+    for device in devices:
+        # Include ALL input devices - virtual, webcams, headphones, etc.
+        device_desc = f"{device.name} ({device.channels}ch, {device.sample_rate}Hz)"
+        if device.is_default:
+            device_desc += " [Current Default]"
+        device_names.append(device_desc)
+        device_map[device_desc] = device.id
+
+    choices = _DeviceChoices(
+        names=device_names,
+        device_map=device_map,
+        lookup={desc.lower(): dev_id for desc, dev_id in device_map.items()},
+        listing="\n".join([f"{i+1}. {name}" for i, name in enumerate(device_names)]),
+    )
+    _device_cache = (time.monotonic(), choices)
+    return choices
+
+
+# Editable text shown in the preferences dialog, one setting per line
+_FORM_TEMPLATE = """hotkey: {hotkey}
+model: {model}
+language: {language}
+insertion_method: {insertion}
+microphone: {microphone}
+start_at_login: {start_at_login}"""
+
+# Accepted spellings for enabling a yes/no setting
+_YES_VALUES = frozenset(("yes", "y", "true", "1", "on"))
+
+
+def _parse_form(text: str) -> Dict[str, str]:
+    """Parse the edited preferences form
+
+    Args:
+        text: Dialog text with one "key: value" setting per line
+
+    Returns:
+        Setting values by lowercase key; lines without a colon or with a
+        blank value are left out, so those settings keep their old value
+    """
+    values: Dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        value = value.strip()
+        if sep and value:
+            values[key.strip().lower()] = value
+    return values
+
 
 class SimplePreferencesWindow:
     """Simple preferences dialog using rumps.Window"""
@@ -19,6 +134,7 @@ class SimplePreferencesWindow:
         config_manager: ConfigManager,
         audio_capture: AudioCapture,
         hotkey_manager: HotkeyManager,
+        on_save: Optional[Callable[[], None]] = None,
     ):
         """Initialize preferences window
 
@@ -26,10 +142,12 @@ class SimplePreferencesWindow:
             config_manager: Application configuration manager
             audio_capture: Audio capture instance
             hotkey_manager: Hotkey manager instance
+            on_save: Called after the settings have been saved
         """
         self.config_manager = config_manager
         self.audio_capture = audio_capture
         self.hotkey_manager = hotkey_manager
+        self.on_save = on_save
         self.startup_manager = StartupManager()
 
     def show(self):
@@ -48,77 +166,9 @@ class SimplePreferencesWindow:
                 self.config_manager.set("start_at_login", start_at_login)
                 self.config_manager.save()
 
-            # Create a multi-field dialog using multiple windows
-            # Hotkey setting
-            window = rumps.Window(
-                title="Recording Hotkey",
-                message="Enter the hotkey combination (e.g., cmd+shift+r):",
-                default_text=current_hotkey,
-                ok="Next",
-                cancel="Cancel",
-                dimensions=(320, 100),
-            )
-            response = window.run()
-            if response.clicked == 0:  # Cancel
-                return
-            new_hotkey = response.text
-
-            # Model setting
-            window = rumps.Window(
-                title="Whisper Model",
-                message="Choose model: tiny.en, base.en, small.en\n(larger = better quality, slower)",
-                default_text=current_model,
-                ok="Next",
-                cancel="Cancel",
-                dimensions=(320, 100),
-            )
-            response = window.run()
-            if response.clicked == 0:  # Cancel
-                return
-            new_model = response.text
-
-            # Language setting
-            window = rumps.Window(
-                title="Language",
-                message="Enter language code (en, es, fr, de, etc):",
-                default_text=current_language,
-                ok="Next",
-                cancel="Cancel",
-                dimensions=(320, 100),
-            )
-            response = window.run()
-            if response.clicked == 0:  # Cancel
-                return
-            new_language = response.text
-
-            # Insertion method
-            window = rumps.Window(
-                title="Text Insertion Method",
-                message="Choose method: clipboard, keyboard, or auto",
-                default_text=current_insertion,
-                ok="Next",
-                cancel="Cancel",
-                dimensions=(320, 100),
-            )
-            response = window.run()
-            if response.clicked == 0:  # Cancel
-                return
-            new_insertion = response.text
-
             # Microphone selection
-            devices = self.audio_capture.list_devices()
-            device_names = ["default (System Default)"]
-            device_map = {"default": None}
-
-            for device in devices:
-                # Include ALL input devices - virtual, webcams, headphones, etc.
-                device_desc = (
-                    f"{device.name} ({device.channels}ch, {device.sample_rate}Hz)"
-                )
-                if device.is_default:
-                    device_desc += " [Current Default]"
-                device_names.append(device_desc)
-                device_map[device_desc] = device.id
+            choices = _get_device_choices(self.audio_capture)
+            device_map = choices.device_map
 
             # Get current device setting
             current_device_id = self.config_manager.get("audio_device_id", None)
@@ -131,37 +181,54 @@ class SimplePreferencesWindow:
                         current_selection = desc
                         break
 
-            # Show device list as text for user to choose
-            device_list = "\n".join(
-                [f"{i+1}. {name}" for i, name in enumerate(device_names)]
+            # All settings are edited in a single dialog, one per line
+            form = _FORM_TEMPLATE.format(
+                hotkey=current_hotkey,
+                model=current_model,
+                language=current_language,
+                insertion=current_insertion,
+                microphone=current_selection,
+                start_at_login="yes" if start_at_login else "no",
             )
             window = rumps.Window(
-                title="Select Microphone",
-                message=f"Available input devices:\n{device_list}\n\nEnter device name or number:",
-                default_text=current_selection,
-                ok="Save All",
+                title="Preferences",
+                message=(
+                    "Edit the values after each colon.\n"
+                    "hotkey: e.g. cmd+shift+r\n"
+                    "model: tiny.en, base.en, small.en "
+                    "(larger = better quality, slower)\n"
+                    "language: en, es, fr, de, etc\n"
+                    "insertion_method: clipboard, keyboard, or auto\n"
+                    "start_at_login: yes or no\n\n"
+                    "Available input devices (microphone: name or number):\n"
+                    f"{choices.listing}"
+                ),
+                default_text=form,
+                ok="Save",
                 cancel="Cancel",
-                dimensions=(400, 300),
+                dimensions=(400, 140),
             )
             response = window.run()
             if response.clicked == 0:  # Cancel
                 return
 
-            # Parse selection
-            selected_text = response.text.strip()
-            selected_device_id = None
-
-            # Check if user entered a number
-            try:
-                device_index = int(selected_text) - 1
-                if 0 <= device_index < len(device_names):
-                    selected_device_id = device_map[device_names[device_index]]
-            except ValueError:
-                # User entered text, find matching device
-                for desc, dev_id in device_map.items():
-                    if selected_text.lower() in desc.lower():
-                        selected_device_id = dev_id
-                        break
+            values = _parse_form(response.text)
+            new_hotkey = values.get("hotkey", current_hotkey)
+            new_model = values.get("model", current_model)
+            new_language = values.get("language", current_language)
+            new_insertion = values.get("insertion_method", current_insertion)
+
+            # Parse microphone selection (number or name); input that
+            # matches no device keeps the current one
+            selected_device_id = current_device_id
+            if "microphone" in values:
+                try:
+                    selected_device_id = choices.find(values["microphone"])
+                except KeyError:
+                    logger.warning(
+                        f"No microphone matches '{values['microphone']}', "
+                        "keeping the current one"
+                    )
 
             # Save all settings
             self.config_manager.set("hotkey", new_hotkey)
@@ -177,15 +244,19 @@ class SimplePreferencesWindow:
                 self.config_manager.set("audio_device", str(selected_device_id))
 
             # Start at login preference
-            response = rumps.alert(
-                title="Start at Login",
-                message="Launch Whisper Transcriber when you log in to your Mac?",
-                ok="Yes",
-                cancel="No",
-            )
-            start_at_login = response == 1
+            was_start_at_login = start_at_login
+            if "start_at_login" in values:
+                start_at_login = values["start_at_login"].lower() in _YES_VALUES
             self.config_manager.set("start_at_login", start_at_login)
 
+            # Login items from older versions would also launch the app;
+            # remove them once, the first time the user changes the setting
+            if start_at_login != was_start_at_login and not self.config_manager.get(
+                "legacy_login_items_removed", False
+            ):
+                self.startup_manager.remove_legacy_login_items()
+                self.config_manager.set("legacy_login_items_removed", True)
+
             # Apply the startup setting
             if self.startup_manager.toggle_startup(start_at_login):
                 logger.info(f"Successfully set start at login to: {start_at_login}")
@@ -198,6 +269,8 @@ class SimplePreferencesWindow:
 
             # Save to disk
             self.config_manager.save()
+            if self.on_save:
+                self.on_save()
 
             # Show confirmation
             rumps.notification(
@@ -1,15 +1,23 @@
 import logging
 import os
-import subprocess
 import plistlib
+import subprocess
+import sys
 from pathlib import Path
+from typing import List
 
 
 logger = logging.getLogger(__name__)
 
 
 class StartupManager:
-    """Manages macOS Login Items for auto-start at system startup"""
+    """Manages a macOS LaunchAgent for auto-start at login"""
+
+    # launchd job label, also used as the plist file name
+    LAUNCH_AGENT_LABEL = "com.whispertranscriber"
+
+    # Name of the System Events login item created by earlier versions
+    LEGACY_LOGIN_ITEM = "WhisperTranscriber"
 
     def __init__(self, app_name: str = "WhisperTranscriber"):
         """Initialize startup manager
@@ -19,6 +27,9 @@ class StartupManager:
         """
         self.app_name = app_name
         self.bundle_path = self._get_app_bundle_path()
+        self.plist_path = Path(
+            f"~/Library/LaunchAgents/{self.LAUNCH_AGENT_LABEL}.plist"
+        ).expanduser()
 
     def _get_app_bundle_path(self) -> str:
         """Get the path to the application bundle or script
@@ -42,62 +53,72 @@ class StartupManager:
 
         # If no .app bundle, return the script path
         # This is for development or when run directly
-        import sys
-
         return sys.executable
 
-    def is_startup_enabled(self) -> bool:
-        """Check if the app is set to start at login
+    def _program_arguments(self) -> List[str]:
+        """Build the command launchd runs at login
 
         Returns:
-            True if startup is enabled
+            Arguments opening the app bundle, or running the package with the
+            current interpreter when no bundle is installed
         """
-        try:
-            # Use osascript to check login items
-            script = """
-            tell application "System Events"
-                get the name of every login item
-            end tell
-            """
+        if self.bundle_path.endswith(".app"):
+            return ["/usr/bin/open", "-a", self.bundle_path]
+        return [self.bundle_path, "-m", "whisper_transcriber.main"]
+
+    def remove_legacy_login_items(self) -> None:
+        """Delete login items created by versions before the LaunchAgent
 
+        Those items keep launching the app regardless of the plist. Scripting
+        System Events may prompt for Automation permission, so callers run
+        this once as a migration rather than on every change. Missing items
+        and systems without osascript are ignored.
+        """
+        deletes = "\n".join(
+            f'try\n delete login item "{name}"\nend try'
+            for name in dict.fromkeys((self.app_name, self.LEGACY_LOGIN_ITEM))
+        )
+        script = f'tell application "System Events"\n{deletes}\nend tell'
+
+        try:
             result = subprocess.run(
                 ["osascript", "-e", script], capture_output=True, text=True
             )
-
-            if result.returncode == 0:
-                login_items = result.stdout.strip()
-                return (
-                    self.app_name in login_items or "WhisperTranscriber" in login_items
-                )
-
+            if result.returncode != 0:
+                logger.debug(f"Could not remove legacy login items: {result.stderr}")
         except Exception as e:
-            logger.error(f"Failed to check startup status: {e}")
+            logger.debug(f"Could not remove legacy login items: {e}")
 
-        return False
+    def is_startup_enabled(self) -> bool:
+        """Check if the app is set to start at login
+
+        Returns:
+            True if startup is enabled
+        """
+        return self.plist_path.exists()
 
     def enable_startup(self) -> bool:
-        """Add the app to macOS login items
+        """Install the LaunchAgent that starts the app at login
+
+        The agent is not loaded into the current session, which would launch
+        a second instance immediately; launchd picks it up at next login.
 
         Returns:
             True if successful
         """
-        try:
-            # Use osascript to add to login items
-            script = f"""
-            tell application "System Events"
-                make new login item at end with properties {{name:"{self.app_name}", path:"{self.bundle_path}", hidden:false}}
-            end tell
-            """
+        agent = {
+            "Label": self.LAUNCH_AGENT_LABEL,
+            "ProgramArguments": self._program_arguments(),
+            "RunAtLoad": True,
+            "KeepAlive": False,
+        }
 
-            result = subprocess.run(
-                ["osascript", "-e", script], capture_output=True, text=True
-            )
-
-            if result.returncode == 0:
-                logger.info(f"Added {self.app_name} to login items")
-                return True
-            else:
-                logger.error(f"Failed to add to login items: {result.stderr}")
+        try:
+            self.plist_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.plist_path, "wb") as f:
+                plistlib.dump(agent, f)
+            logger.info(f"Installed launch agent {self.plist_path}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to enable startup: {e}")
@@ -105,47 +126,25 @@ class StartupManager:
         return False
 
     def disable_startup(self) -> bool:
-        """Remove the app from macOS login items
+        """Remove the LaunchAgent
+
+        The job is not unloaded, since that would terminate the app if
+        launchd started it.
 
         Returns:
             True if successful
         """
         try:
-            # Use osascript to remove from login items
-            script = f"""
-            tell application "System Events"
-                delete login item "{self.app_name}"
-            end tell
-            """
-
-            result = subprocess.run(
-                ["osascript", "-e", script], capture_output=True, text=True
-            )
-
-            # Also try with alternate name
-            if result.returncode != 0:
-                script = """
-                tell application "System Events"
-                    delete login item "WhisperTranscriber"
-                end tell
-                """
-
-                result = subprocess.run(
-                    ["osascript", "-e", script], capture_output=True, text=True
-                )
-
-            if result.returncode == 0:
-                logger.info(f"Removed {self.app_name} from login items")
-                return True
-            else:
-                # It might not exist, which is fine
-                logger.debug(f"Could not remove from login items: {result.stderr}")
-                return True
-
+            self.plist_path.unlink()
+            logger.info(f"Removed launch agent {self.plist_path}")
+        except FileNotFoundError:
+            # It might not exist, which is fine
+            logger.debug("Launch agent was not installed")
         except Exception as e:
             logger.error(f"Failed to disable startup: {e}")
+            return False
 
-        return False
+        return True
 
     def toggle_startup(self, enabled: bool) -> bool:
         """Enable or disable startup at login
@@ -157,8 +156,7 @@ class StartupManager:
             True if successful
         """
         if enabled:
-            # First disable to avoid duplicates
-            self.disable_startup()
+            # Rewriting the plist replaces any existing agent
             return self.enable_startup()
         else:
             return self.disable_startup()
@@ -1,7 +1,8 @@
 import logging
 import platform
-import time
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Optional
 
 import pyperclip
 from pynput import keyboard
@@ -9,8 +10,48 @@ from pynput import keyboard
 from .models import InsertMethod
 
 
+# AppKit comes with rumps' pyobjc dependency on macOS; elsewhere the
+# clipboard is accessed through pyperclip
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+except ImportError:
+    NSPasteboard = None
+
+# Quartz comes with pynput on macOS and lets text be typed as a few unicode
+# events instead of one key event per character
+try:
+    import Quartz
+except ImportError:
+    Quartz = None
+
+
 logger = logging.getLogger(__name__)
 
+# UTF-16 code units a single keyboard event can carry
+_UNICODE_EVENT_MAX_UNITS = 20
+
+
+def _utf16_chunks(text: str, max_units: int) -> Iterator[str]:
+    """Split text into pieces of at most max_units UTF-16 code units
+
+    Args:
+        text: Text to split; surrogate pairs are never split
+        max_units: Maximum UTF-16 code units per piece
+
+    Yields:
+        Consecutive pieces of text
+    """
+    start = 0
+    units = 0
+    for i, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if units + width > max_units:
+            yield text[start:i]
+            start, units = i, 0
+        units += width
+    if start < len(text):
+        yield text[start:]
+
 
 class TextInserter:
     """Manages text insertion into active applications"""
@@ -18,26 +59,84 @@ class TextInserter:
     # Threshold for auto method selection
     AUTO_THRESHOLD_LENGTH = 50
 
+    # Seconds the pasted text stays on the clipboard before the original
+    # content is restored, giving the target app time to read it
+    RESTORE_DELAY_SECONDS = 0.2
+
+    # Method name strings accepted by insert_text
+    _METHOD_MAP = {m.value: m for m in InsertMethod}
+
+    # Insertion method to the name of the method implementing it
+    _INSERTERS = {
+        InsertMethod.CLIPBOARD: "_clipboard_method",
+        InsertMethod.KEYBOARD: "_keyboard_method",
+    }
+
     def __init__(self):
         """Initialize TextInserter"""
         self.original_clipboard = None
         self._platform = platform.system()
+        self._paste_modifier = (
+            keyboard.Key.cmd if self._platform == "Darwin" else keyboard.Key.ctrl
+        )
+        self._keyboard: Optional[keyboard.Controller] = None
+        # Native pasteboard on macOS, avoiding a pbcopy/pbpaste process per call
+        self._pasteboard = (
+            NSPasteboard.generalPasteboard()
+            if NSPasteboard is not None and self._platform == "Darwin"
+            else None
+        )
+        # Guards original_clipboard against the deferred restore
+        self._clipboard_lock = threading.Lock()
+        self._restore_timer: Optional[threading.Timer] = None
+        # Text most recently placed on the clipboard for pasting
+        self._last_copied: Optional[str] = None
+        # Single worker keeps insertions ordered and off the caller's thread
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="text-insert"
+        )
+
+    @property
+    def _controller(self) -> keyboard.Controller:
+        """Keyboard controller, created on first use and then reused"""
+        if self._keyboard is None:
+            self._keyboard = keyboard.Controller()
+        return self._keyboard
 
     def insert_text(
         self, text: str, method: InsertMethod = InsertMethod.CLIPBOARD
-    ) -> None:
+    ) -> "Future[None]":
         """Insert text using specified method
 
+        Insertions run in order on a dedicated worker thread so the caller is
+        never blocked by clipboard or keyboard work.
+
         Args:
             text: Text to insert
             method: Insertion method to use
+
+        Returns:
+            Future completing when the text has been inserted, raising any
+            insertion error
+
+        Raises:
+            ValueError: If method is not a valid insertion method
         """
         if isinstance(method, str):
-            try:
-                method = InsertMethod(method)
-            except ValueError:
+            resolved = self._METHOD_MAP.get(method)
+            if resolved is None:
                 raise ValueError(f"Invalid insert method: {method}")
+            method = resolved
 
+        return self._executor.submit(self._insert_sync, text, method)
+
+    def _insert_sync(self, text: str, method: InsertMethod) -> None:
+        """Insert text on the worker thread
+
+        Args:
+            text: Text to insert
+            method: Insertion method to use
+        """
         if method == InsertMethod.AUTO:
             # Choose method based on text characteristics
             if len(text) > self.AUTO_THRESHOLD_LENGTH or "\n" in text:
@@ -46,10 +145,7 @@ class TextInserter:
                 method = InsertMethod.KEYBOARD
 
         try:
-            if method == InsertMethod.CLIPBOARD:
-                self._clipboard_method(text)
-            elif method == InsertMethod.KEYBOARD:
-                self._keyboard_method(text)
+            getattr(self, self._INSERTERS[method])(text)
         except Exception as e:
             logger.error(f"Failed to insert text with {method.value} method: {e}")
             # Try fallback method
@@ -62,70 +158,168 @@ class TextInserter:
     def _clipboard_method(self, text: str) -> None:
         """Insert via clipboard (most reliable)
 
+        The original clipboard is restored RESTORE_DELAY_SECONDS after the
+        paste without blocking the caller.
+
         Args:
             text: Text to insert
         """
         try:
             logger.debug(f"Starting clipboard method for text: '{text}'")
 
+            # A pending restore still holds the user's original content
+            with self._clipboard_lock:
+                restore_pending = self._cancel_restore()
+
             # Save original clipboard content
-            try:
-                self.original_clipboard = pyperclip.paste()
-                logger.debug(f"Saved original clipboard content")
-            except Exception:
-                logger.warning("Could not retrieve original clipboard content")
-                self.original_clipboard = ""
-
-            # Copy new text to clipboard
-            pyperclip.copy(text)
+            if not restore_pending:
+                try:
+                    self.original_clipboard = self._clipboard_get()
+                    logger.debug(f"Saved original clipboard content")
+                except Exception:
+                    logger.warning("Could not retrieve original clipboard content")
+                    # None marks an original that could not be read
+                    self.original_clipboard = None
+
+            # Copy new text to clipboard; the copy has completed on return
+            self._clipboard_set(text)
+            self._last_copied = text
             logger.debug(f"Copied text to clipboard")
-            time.sleep(0.1)  # Small delay for clipboard to update
 
             # Paste using platform-specific shortcut
             logger.debug(f"Executing paste keyboard shortcut")
             self._paste_with_keyboard()
 
-            # Wait for paste to complete
-            time.sleep(0.2)
-
-            # Restore original clipboard
-            self._restore_clipboard()
+            # Restore original clipboard once the paste has been read
+            self._schedule_restore()
             logger.debug(f"Clipboard method completed successfully")
 
         except Exception as e:
             logger.error(f"Clipboard method failed: {e}")
             raise
 
+    def _clipboard_get(self) -> str:
+        """Read text from the clipboard
+
+        Returns:
+            Clipboard text, empty if it holds no text
+        """
+        if self._pasteboard is None:
+            return pyperclip.paste()
+        return self._pasteboard.stringForType_(NSPasteboardTypeString) or ""
+
+    def _clipboard_set(self, text: str) -> None:
+        """Replace the clipboard contents with text
+
+        Args:
+            text: Text to place on the clipboard
+
+        Raises:
+            RuntimeError: If the pasteboard rejects the text
+        """
+        if self._pasteboard is None:
+            pyperclip.copy(text)
+            return
+        self._pasteboard.clearContents()
+        if not self._pasteboard.setString_forType_(text, NSPasteboardTypeString):
+            raise RuntimeError("Could not write text to the pasteboard")
+
     def _keyboard_method(self, text: str) -> None:
         """Type text directly (fallback)
 
         Args:
             text: Text to type
         """
-        controller = keyboard.Controller()
-        controller.type(text)
+        if self._platform == "Darwin" and Quartz is not None and text.isprintable():
+            self._type_unicode(text)
+        else:
+            self._controller.type(text)
+
+    def _type_unicode(self, text: str) -> None:
+        """Type text as unicode keyboard events (macOS)
+
+        Control characters such as newlines need real key presses and are
+        left to pynput.
+
+        Args:
+            text: Printable text to type
+        """
+        for chunk in _utf16_chunks(text, _UNICODE_EVENT_MAX_UNITS):
+            units = len(chunk.encode("utf-16-le")) // 2
+            for key_down in (True, False):
+                event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+                Quartz.CGEventKeyboardSetUnicodeString(event, units, chunk)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def _schedule_restore(self) -> None:
+        """Restore the original clipboard after RESTORE_DELAY_SECONDS"""
+        timer = threading.Timer(
+            self.RESTORE_DELAY_SECONDS, lambda: self._deferred_restore(timer)
+        )
+        timer.daemon = True
+        with self._clipboard_lock:
+            self._restore_timer = timer
+        timer.start()
+
+    def _deferred_restore(self, timer: threading.Timer) -> None:
+        """Restore the clipboard unless a newer insertion took over the timer
+
+        Args:
+            timer: Timer that invoked this restore
+        """
+        with self._clipboard_lock:
+            if self._restore_timer is not timer:
+                return
+            self._restore_timer = None
+            self._restore_clipboard()
+
+    def _cancel_restore(self) -> bool:
+        """Cancel a pending restore; must be called with _clipboard_lock held
+
+        Returns:
+            True if a restore was pending
+        """
+        timer = self._restore_timer
+        if timer is None:
+            return False
+        self._restore_timer = None
+        timer.cancel()
+        return True
+
+    def close(self) -> None:
+        """Finish queued insertions and restore the original clipboard"""
+        self._executor.shutdown(wait=True)
+        self.flush()
+
+    def flush(self) -> None:
+        """Restore the original clipboard now if a restore is pending"""
+        with self._clipboard_lock:
+            if self._cancel_restore():
+                self._restore_clipboard()
 
     def _restore_clipboard(self) -> None:
-        """Restore original clipboard contents"""
-        if self.original_clipboard is not None:
-            try:
-                pyperclip.copy(self.original_clipboard)
-                self.original_clipboard = None
-            except Exception as e:
-                logger.warning(f"Could not restore clipboard: {e}")
+        """Restore original clipboard contents
+
+        Skipped when the original already equals the pasted text, since the
+        clipboard would not change. An original that could not be read is
+        restored as an empty clipboard so the pasted text does not linger.
+        """
+        original = self.original_clipboard
+        if original == self._last_copied:
+            self.original_clipboard = None
+            return
+        try:
+            self._clipboard_set("" if original is None else original)
+            self.original_clipboard = None
+        except Exception as e:
+            logger.warning(f"Could not restore clipboard: {e}")
 
     def _paste_with_keyboard(self) -> None:
         """Execute platform-specific paste keyboard shortcut"""
-        controller = keyboard.Controller()
-
-        if self._platform == "Darwin":  # macOS
-            with controller.pressed(keyboard.Key.cmd):
-                controller.press("v")
-                controller.release("v")
-        else:  # Windows, Linux
-            with controller.pressed(keyboard.Key.ctrl):
-                controller.press("v")
-                controller.release("v")
+        controller = self._controller
+        with controller.pressed(self._paste_modifier):
+            controller.press("v")
+            controller.release("v")
 
     def get_clipboard_content(self) -> str:
         """Get current clipboard content
@@ -134,7 +328,7 @@ class TextInserter:
             Clipboard content as string
         """
         try:
-            return pyperclip.paste()
+            return self._clipboard_get()
         except Exception as e:
             logger.error(f"Failed to get clipboard content: {e}")
             return ""
@@ -1,13 +1,15 @@
-import json
 import logging
 import subprocess
 import threading
 import time
 import shutil
+import socket
 import os
 import sys
-from typing import Callable, Optional, Dict, Any
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Optional, Dict, Any, List, Union
 
+import orjson
 import websocket
 
 from .models import ServerConfig
@@ -23,6 +25,9 @@ if os.path.exists(local_whisperlivekit):
     sys.path.insert(0, local_whisperlivekit)
     logger.info(f"Using local whisperlivekit from {local_whisperlivekit}")
 
+# Opcode for audio frames, bound once instead of looked up per send
+_OPCODE_BINARY = websocket.ABNF.OPCODE_BINARY
+
 
 class TranscriptionError(Exception):
     """Exception raised for transcription-related errors"""
@@ -30,9 +35,216 @@ class TranscriptionError(Exception):
     pass
 
 
+class _SendCoalescer:
+    """Batches small binary payloads and sends them from a sender thread
+
+    add() only appends a copy of the chunk to a deque and wakes the sender
+    thread, so the producer (the audio callback) never blocks on the socket
+    or takes the send lock. The sender waits up to max_delay after the
+    first pending chunk, or until max_bytes are pending, then joins the
+    queued chunks into payloads of about max_bytes each. Payloads are
+    plain bytes: websocket-client masks bytes with one C-level copy but
+    walks other buffer types element by element.
+    """
+
+    # Seconds close() waits for the sender thread and for the drain lock
+    CLOSE_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        send: Callable[[bytes], None],
+        max_delay: float,
+        max_bytes: int,
+        max_backlog: int,
+    ):
+        """Initialize the coalescer
+
+        Args:
+            send: Function sending one concatenated payload
+            max_delay: Maximum seconds a chunk waits before being sent
+            max_bytes: Pending size that triggers an immediate send
+            max_backlog: Pending size above which new chunks are dropped
+        """
+        self._send = send
+        self._max_delay = max_delay
+        self._max_bytes = max_bytes
+        self._max_backlog = max_backlog
+        # Single producer, single consumer: deque append and popleft are
+        # atomic, and each byte counter is only written by one side
+        self._pending: Deque[bytes] = deque()
+        self._queued_bytes = 0
+        self._taken_bytes = 0
+        self._overrun = False
+        # Set on every add, and once max_bytes are pending
+        self._wake = threading.Event()
+        self._full = threading.Event()
+        # Each sender thread gets its own stop event, so one that close()
+        # gave up on cannot be revived by a later start()
+        self._stop: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        # Serializes draining so payloads go out in capture order
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the sender thread if it is not already running"""
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop,), name="ws-sender", daemon=True
+            )
+            self._thread.start()
+
+    def add(self, data: Union[bytes, memoryview]) -> None:
+        """Queue a copy of data for the sender thread
+
+        Args:
+            data: Bytes-like payload
+        """
+        length = len(data)
+        if self._queued_bytes - self._taken_bytes + length > self._max_backlog:
+            # The sender has fallen behind; drop audio rather than block
+            if not self._overrun:
+                self._overrun = True
+                logger.warning("Audio send backlog full, dropping audio")
+            return
+
+        self._overrun = False
+        self._pending.append(bytes(data))
+        self._queued_bytes += length
+        if self._queued_bytes - self._taken_bytes >= self._max_bytes:
+            self._full.set()
+        self._wake.set()
+
+    def flush(self) -> None:
+        """Send everything queued now, from the calling thread"""
+        self._drain()
+
+    def _drain(self, stop: Optional[threading.Event] = None) -> None:
+        """Send queued chunks in order until none are left or stop is set
+
+        Args:
+            stop: Stop event of the sender thread draining, if any
+        """
+        with self._lock:
+            pending = self._pending
+            while pending and not (stop is not None and stop.is_set()):
+                chunks = []
+                size = 0
+                while pending and size < self._max_bytes:
+                    chunk = pending.popleft()
+                    chunks.append(chunk)
+                    size += len(chunk)
+                self._taken_bytes += size
+                self._send(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+
+    def close(self) -> None:
+        """Stop the sender thread and drop any pending data
+
+        Waits at most CLOSE_TIMEOUT for the sender thread and again for the
+        drain lock, so a send blocked on a stalled socket cannot hang the
+        caller.
+        """
+        with self._thread_lock:
+            thread = self._thread
+            stop = self._stop
+            self._thread = None
+            self._stop = None
+            if stop is not None:
+                stop.set()
+            self._wake.set()
+            self._full.set()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.CLOSE_TIMEOUT)
+            if thread.is_alive():
+                logger.warning("Audio sender thread did not exit")
+
+        # A sender stuck in send() has already counted its payload as
+        # taken; its stop event ends its drain after that payload
+        locked = self._lock.acquire(timeout=self.CLOSE_TIMEOUT)
+        try:
+            self._pending.clear()
+            self._taken_bytes = self._queued_bytes
+        finally:
+            if locked:
+                self._lock.release()
+
+    def _run(self, stop: threading.Event) -> None:
+        while True:
+            self._wake.wait()
+            # Give later chunks max_delay to join the first one, unless a
+            # full payload is already pending
+            self._full.wait(self._max_delay)
+            # A stopped sender leaves the wake-up for a newer thread
+            if stop.is_set():
+                return
+            # Clear before draining: chunks are queued before the wake-up,
+            # so anything added after this point wakes the next iteration
+            self._wake.clear()
+            self._full.clear()
+            self._drain(stop)
+
+
 class TranscriptionService:
     """Manages WhisperLiveKit integration"""
 
+    # Number of recent final lines remembered for duplicate suppression
+    SENT_TEXT_HISTORY = 1024
+
+    # Outgoing audio is coalesced for up to this long or this many bytes
+    SEND_COALESCE_SECONDS = 0.01
+    SEND_COALESCE_BYTES = 32 * 1024
+
+    # Queued outgoing audio beyond which new chunks are dropped (~30 s at
+    # 16 kHz 16-bit mono)
+    SEND_BACKLOG_BYTES = 1024 * 1024
+
+    # Applied to the WebSocket's TCP socket before it connects: disable
+    # Nagle so the coalescer alone controls batching, and size the send
+    # buffer for coalesced bursts
+    SOCKET_OPTIONS = (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024),
+    )
+
+    # WebSocket keepalive settings in seconds
+    PING_INTERVAL = 20
+    PING_TIMEOUT = 10
+
+    # A failed or dropped connection is retried after this many seconds, up
+    # to MAX_RECONNECT_ATTEMPTS times in a row; connect_websocket gives up
+    # after CONNECT_TIMEOUT
+    RECONNECT_DELAY = 1
+    MAX_RECONNECT_ATTEMPTS = 10
+    CONNECT_TIMEOUT = 6.0
+
+    # Seconds to wait for a replaced client's thread to exit
+    WS_THREAD_JOIN_TIMEOUT = 2.0
+
+    # Longest wait for the server's ready_to_stop after the stop signal
+    STOP_ACK_TIMEOUT = 0.1
+
+    # Trailing characters compared when checking if a buffer extends the last one
+    BUFFER_ANCHOR_CHARS = 64
+
+    # Most recent server output lines kept for diagnostics
+    SERVER_OUTPUT_LINES = 200
+
+    # Seconds start_server waits for the new server to accept connections
+    STARTUP_TIMEOUT = 10.0
+
+    # Seconds to wait for the server port while pre-warming the WebSocket
+    PREWARM_TIMEOUT = 30.0
+
+    # Seconds without new text after which buffer tracking starts over
+    SILENCE_TIMEOUT_SECONDS = 3.0
+
+    # Control message types and the methods that fully handle them
+    _MESSAGE_HANDLERS = {"ready_to_stop": "_handle_ready_to_stop"}
+
     def __init__(self, server_config: ServerConfig):
         """Initialize TranscriptionService
 
@@ -41,14 +253,84 @@ class TranscriptionService:
         """
         self.server_config = server_config
         self.server_process: Optional[subprocess.Popen] = None
+        # Tail of the server's combined stdout/stderr, filled by a drain thread
+        self._server_output: Deque[bytes] = deque(maxlen=self.SERVER_OUTPUT_LINES)
+        self._output_thread: Optional[threading.Thread] = None
         self.websocket_client: Optional[websocket.WebSocketApp] = None
-        self.is_connected = False
+        # Set by _on_open, cleared on error/close; connect waits on it
+        self._connected = threading.Event()
+        # Set on ready_to_stop or when the connection drops
+        self._stop_acked = threading.Event()
         self.transcription_callback: Optional[Callable[[str, bool], None]] = None
         self._ws_thread: Optional[threading.Thread] = None
+        # Set to stop the current client's thread from reconnecting
+        self._ws_stop = threading.Event()
+        self._reconnect_attempts = 0
         self._lock = threading.Lock()
-        self._audio_buffer = bytearray()
-        self._buffer_lock = threading.Lock()
-        self._last_send_time = time.time()
+        self._connect_lock = threading.Lock()
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self._send_coalescer = _SendCoalescer(
+            self._send_binary,
+            self.SEND_COALESCE_SECONDS,
+            self.SEND_COALESCE_BYTES,
+            self.SEND_BACKLOG_BYTES,
+        )
+        # Bounded history of hashes of final lines already delivered, oldest
+        # first; str hashes are cached, so lookups never rehash the text
+        self._sent_hashes: "OrderedDict[int, None]" = OrderedDict()
+        # Raw previous frame; the server repeats frames while the user is silent
+        self._last_message: Union[str, bytes, None] = None
+        # Previous buffer_transcription, used to send only what was appended
+        self._last_buffer_text = ""
+        self._last_buffer_content = ""
+        self._last_meaningful_transcription_time: Optional[float] = None
+        # Server arguments, built once from the config
+        self._server_cmd = self._build_server_cmd(server_config)
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the WebSocket connection is open"""
+        return self._connected.is_set()
+
+    @is_connected.setter
+    def is_connected(self, value: bool) -> None:
+        if value:
+            self._connected.set()
+        else:
+            self._connected.clear()
+
+    @staticmethod
+    def _build_server_cmd(server_config: ServerConfig) -> List[str]:
+        """Build whisperlivekit-server arguments from the server configuration
+
+        Args:
+            server_config: Server configuration settings
+
+        Returns:
+            Command line arguments, excluding the executable
+        """
+        cmd = [
+            "--host",
+            server_config.host,
+            "--port",
+            str(server_config.port),
+            "--model",
+            server_config.model,
+            "--lan",  # whisperlivekit uses --lan instead of --language
+            server_config.language,
+        ]
+
+        # whisperlivekit uses --no-vad to disable VAD (VAD is on by default)
+        if not server_config.vad_enabled:
+            cmd.append("--no-vad")
+
+        # Enable raw PCM mode to avoid WebM encoding/decoding
+        cmd.append("--raw-pcm")
+        return cmd
+
+    def rebuild_cmd(self) -> None:
+        """Rebuild the server arguments after server_config has changed"""
+        self._server_cmd = self._build_server_cmd(self.server_config)
 
     def start_server(self) -> bool:
         """Launch WhisperLiveKit server subprocess
@@ -85,50 +367,47 @@ class TranscriptionService:
                     logger.error("whisperlivekit-server command not found")
                     logger.error("Please install with: pip install whisperlivekit")
                     return False
+                whisperlivekit_cmd = os.path.abspath(whisperlivekit_cmd)
 
-                # Build command
-                cmd = [
-                    whisperlivekit_cmd,
-                    "--host",
-                    self.server_config.host,
-                    "--port",
-                    str(self.server_config.port),
-                    "--model",
-                    self.server_config.model,
-                    "--lan",  # whisperlivekit uses --lan instead of --language
-                    self.server_config.language,
-                ]
-
-                # whisperlivekit uses --no-vad to disable VAD (VAD is on by default)
-                if not self.server_config.vad_enabled:
-                    cmd.append("--no-vad")
-
-                # Enable raw PCM mode to avoid WebM encoding/decoding
-                cmd.append("--raw-pcm")
+                cmd = [whisperlivekit_cmd, *self._server_cmd]
 
                 logger.info(
                     f"Starting WhisperLiveKit server with command: {' '.join(cmd)}"
                 )
 
-                # Start server process
+                # Start server process. Keep this call eligible for CPython's
+                # posix_spawn fast path: absolute executable, close_fds=False
+                # (our own FDs are non-inheritable per PEP 446) and no
+                # preexec_fn, pass_fds, cwd or start_new_session.
                 self.server_process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                    cmd,
+                    executable=whisperlivekit_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    close_fds=False,
                 )
+                self._start_output_drain()
 
-                # Wait a bit for server to start
-                time.sleep(1.5)
+                # Wait for the port to open, returning early if the server exits
+                ready = self._wait_for_port(self.STARTUP_TIMEOUT)
 
                 # Check if process is still running
                 if self.server_process.poll() is None:
+                    if not ready:
+                        logger.warning(
+                            f"Server port not open after {self.STARTUP_TIMEOUT}s, "
+                            "continuing while it loads"
+                        )
                     logger.info(f"Server started with PID {self.server_process.pid}")
+                    self._start_prewarm()
                     return True
                 else:
-                    # Get error output
-                    stdout, stderr = self.server_process.communicate()
+                    # The process has exited, so the drain thread hits EOF
+                    self._output_thread.join(timeout=1)
+                    output = b"".join(self._server_output).decode(errors="replace")
                     logger.error(f"Server process terminated immediately")
                     logger.error(f"Command was: {' '.join(cmd)}")
-                    logger.error(f"stdout: {stdout}")
-                    logger.error(f"stderr: {stderr}")
+                    logger.error(f"Server output: {output}")
                     self.server_process = None
                     return False
 
@@ -137,8 +416,77 @@ class TranscriptionService:
                 self.server_process = None
                 return False
 
+    def _start_output_drain(self) -> None:
+        """Read the server's output continuously so its pipe never fills"""
+        # A fresh deque per process keeps a previous drain thread from
+        # mixing old output into the new tail
+        self._server_output = deque(maxlen=self.SERVER_OUTPUT_LINES)
+        self._output_thread = threading.Thread(
+            target=self._drain_output,
+            args=(self.server_process.stdout, self._server_output),
+            name="server-output",
+            daemon=True,
+        )
+        self._output_thread.start()
+
+    @staticmethod
+    def _drain_output(stream, output: Deque[bytes]) -> None:
+        """Append raw output lines to output until the stream closes
+
+        Args:
+            stream: Binary pipe connected to the server's stdout and stderr
+            output: Bounded deque receiving the lines
+        """
+        try:
+            for line in stream:
+                output.append(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            stream.close()
+
+    def _start_prewarm(self) -> None:
+        """Open the WebSocket in the background once the server is listening"""
+        if not self.transcription_callback:
+            return
+
+        self._prewarm_thread = threading.Thread(
+            target=self._prewarm_websocket, daemon=True
+        )
+        self._prewarm_thread.start()
+
+    def _prewarm_websocket(self) -> None:
+        """Wait for the server port and connect ahead of the first recording"""
+        if not self._wait_for_port(self.PREWARM_TIMEOUT):
+            logger.warning("Server port not ready, skipping WebSocket pre-warm")
+            return
+
+        if self.connect_websocket():
+            logger.info("WebSocket pre-warmed")
+
+    def _wait_for_port(self, timeout: float) -> bool:
+        """Poll until the server accepts TCP connections
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the port is accepting connections, False otherwise
+        """
+        address = (self.server_config.host, self.server_config.port)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.is_server_running():
+                return False
+            try:
+                with socket.create_connection(address, timeout=0.5):
+                    return True
+            except OSError:
+                time.sleep(0.05)
+        return False
+
     def connect_websocket(self) -> bool:
-        """Establish WebSocket connection
+        """Establish WebSocket connection, reusing a pre-warmed one if open
 
         Returns:
             True if connection established, False otherwise
@@ -147,83 +495,159 @@ class TranscriptionService:
             logger.error("No transcription callback set")
             return False
 
+        with self._connect_lock:
+            if self.is_connected and self.websocket_client:
+                logger.debug("Reusing open WebSocket connection")
+                return True
+            return self._open_websocket()
+
+    def _open_websocket(self) -> bool:
+        """Create the WebSocket client and wait for it to connect
+
+        Returns:
+            True if connection established, False otherwise
+        """
         try:
+            # A dropped client may still be reconnecting in the background;
+            # stop it so two clients never deliver messages at once
+            self._stop_websocket_thread()
+
             # Create WebSocket app
-            self.websocket_client = websocket.WebSocketApp(
-                self.server_config.websocket_url,
-                on_open=self._on_open,
-                on_message=self._on_message,
-                on_error=self._on_error,
-                on_close=self._on_close,
+            self.websocket_client = self._create_websocket_app()
+
+            # Run WebSocket in separate thread; it keeps retrying the same
+            # client until it connects or is closed
+            self._ws_stop = threading.Event()
+            self._ws_thread = threading.Thread(
+                target=self._run_websocket,
+                args=(self.websocket_client, self._ws_stop),
+                daemon=True,
             )
-
-            # Run WebSocket in separate thread
-            self._ws_thread = threading.Thread(target=self._run_websocket, daemon=True)
             self._ws_thread.start()
 
-            # Wait for connection with retries
-            max_retries = 3
-            retry_delay = 0.5
-
-            for attempt in range(max_retries):
-                if attempt > 0:
-                    logger.info(
-                        f"Retrying connection (attempt {attempt + 1}/{max_retries})..."
-                    )
-                    time.sleep(retry_delay)
-
-                    # Re-create WebSocket app for retry
-                    self.websocket_client = websocket.WebSocketApp(
-                        self.server_config.websocket_url,
-                        on_open=self._on_open,
-                        on_message=self._on_message,
-                        on_error=self._on_error,
-                        on_close=self._on_close,
-                    )
-
-                    # Run WebSocket in separate thread
-                    self._ws_thread = threading.Thread(
-                        target=self._run_websocket, daemon=True
-                    )
-                    self._ws_thread.start()
-
-                # Wait for connection
-                timeout = 2
-                start_time = time.time()
-                while not self.is_connected and time.time() - start_time < timeout:
-                    time.sleep(0.05)
-
-                if self.is_connected:
-                    return True
+            # Block until _on_open signals the connection or we time out
+            if self._connected.wait(timeout=self.CONNECT_TIMEOUT):
+                return True
 
+            # Stop the client so it does not keep retrying in the background
+            logger.error(f"WebSocket not connected after {self.CONNECT_TIMEOUT}s")
+            self._ws_stop.set()
+            self.websocket_client.close()
+            self.websocket_client = None
             return False
 
         except Exception as e:
             logger.error(f"Failed to connect WebSocket: {e}")
             return False
 
-    def _run_websocket(self):
-        """Run WebSocket client (in separate thread)"""
+    def _stop_websocket_thread(self) -> None:
+        """Close the current client, if any, and wait for its thread to exit"""
+        client = self.websocket_client
+        thread = self._ws_thread
+        self.websocket_client = None
+        self._ws_thread = None
+        self._ws_stop.set()
+
+        if client is not None:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing previous WebSocket: {e}")
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.WS_THREAD_JOIN_TIMEOUT)
+            if thread.is_alive():
+                logger.warning("Previous WebSocket thread did not exit")
+
+    def _create_websocket_app(self) -> websocket.WebSocketApp:
+        """Create the WebSocket client for the server's /asr endpoint
+
+        websocket-client never offers permessage-deflate, so frames are sent
+        uncompressed; raw PCM and short JSON messages gain nothing from it.
+        Do not add a Sec-WebSocket-Extensions header here.
+
+        Returns:
+            Configured WebSocketApp
+        """
+        return websocket.WebSocketApp(
+            self.server_config.websocket_url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close,
+        )
+
+    def _run_websocket(
+        self, client: websocket.WebSocketApp, stop: threading.Event
+    ) -> None:
+        """Run WebSocket client (in separate thread)
+
+        A refused or dropped connection is retried every RECONNECT_DELAY
+        seconds until stop is set or MAX_RECONNECT_ATTEMPTS attempts in a
+        row fail, so a stopped server is not polled forever.
+
+        Args:
+            client: WebSocket client to run
+            stop: Event set when the client is closed or replaced
+        """
+        self._reconnect_attempts = 0
         try:
-            self.websocket_client.run_forever()
+            while True:
+                # Skip UTF-8 validation of text frames: the server only
+                # sends JSON it encoded itself. Pings detect a dead server
+                # connection.
+                client.run_forever(
+                    sockopt=self.SOCKET_OPTIONS,
+                    skip_utf8_validation=True,
+                    ping_interval=self.PING_INTERVAL,
+                    ping_timeout=self.PING_TIMEOUT,
+                )
+                if stop.wait(self.RECONNECT_DELAY):
+                    return
+                self._reconnect_attempts += 1
+                if self._reconnect_attempts > self.MAX_RECONNECT_ATTEMPTS:
+                    logger.warning(
+                        "WebSocket did not reconnect after "
+                        f"{self.MAX_RECONNECT_ATTEMPTS} attempts, giving up"
+                    )
+                    return
+                logger.info("Reconnecting WebSocket")
         except Exception as e:
             logger.error(f"WebSocket error: {e}")
             self.is_connected = False
 
-    def send_audio_chunk(self, audio_data: bytes) -> None:
-        """Stream audio to transcription server directly as raw PCM
+    def send_audio_chunk(self, audio_data: Union[bytes, memoryview]) -> None:
+        """Stream audio to transcription server as raw PCM
+
+        Chunks are copied and handed to a sender thread, which coalesces
+        them into larger WebSocket frames, see SEND_COALESCE_SECONDS and
+        SEND_COALESCE_BYTES. This never blocks on the socket, so it is
+        safe to call from the audio callback.
 
         Args:
-            audio_data: Raw audio data bytes (PCM format)
+            audio_data: Raw audio data (PCM format), bytes or any
+                bytes-like buffer
         """
         if not self.is_connected or not self.websocket_client:
             logger.debug(f"Cannot send audio: not connected")
             return
 
+        self._send_coalescer.add(audio_data)
+
+    def _send_binary(self, payload: bytes) -> None:
+        """Send one coalesced PCM payload over the WebSocket
+
+        Args:
+            payload: Raw audio data
+        """
+        client = self.websocket_client
+        if not self.is_connected or not client:
+            return
+
         try:
-            # Send raw PCM data directly to server
-            self.websocket_client.send(audio_data, opcode=websocket.ABNF.OPCODE_BINARY)
-            logger.debug(f"Sent PCM chunk: {len(audio_data)} bytes")
+            client.send(payload, opcode=_OPCODE_BINARY)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sent PCM chunk: {len(payload)} bytes")
         except Exception as e:
             logger.error(f"Failed to send PCM chunk: {e}")
 
@@ -241,7 +665,11 @@ class TranscriptionService:
                 logger.error(f"Error in transcription callback: {e}")
 
     def stop_server(self) -> None:
-        """Stop the WhisperLiveKit server"""
+        """Stop the WhisperLiveKit server and close any WebSocket client"""
+        # A pre-warmed client would otherwise keep reconnecting to the
+        # stopped server
+        self.disconnect_websocket()
+
         with self._lock:
             if not self.server_process:
                 return
@@ -266,63 +694,79 @@ class TranscriptionService:
     def disconnect_websocket(self) -> None:
         """Close WebSocket connection"""
         if self.websocket_client:
+            # Deliver audio still waiting in the coalescer before stopping
+            self._send_coalescer.flush()
+            if self.is_connected:
+                self._stop_acked.clear()
+            else:
+                self._stop_acked.set()
             try:
                 # Send empty buffer as stop signal (like the web client does)
-                self.websocket_client.send(b"", opcode=websocket.ABNF.OPCODE_BINARY)
+                self.websocket_client.send(b"", opcode=_OPCODE_BINARY)
                 logger.debug("Sent stop signal (empty buffer)")
-                time.sleep(0.1)  # Give server time to process
-                self.websocket_client.close()
+                # Give server time to process, returning early once it
+                # acknowledges or the connection drops
+                self._stop_acked.wait(timeout=self.STOP_ACK_TIMEOUT)
             except Exception as e:
                 logger.error(f"Error closing WebSocket: {e}")
             finally:
+                # Close even if the stop signal failed, so a client whose
+                # server is gone stops reconnecting
+                self._ws_stop.set()
+                try:
+                    self.websocket_client.close()
+                except Exception as e:
+                    logger.debug(f"Error closing WebSocket: {e}")
                 self.websocket_client = None
                 self.is_connected = False
 
         # Reset transcription tracking when disconnecting
-        if hasattr(self, "_sent_texts"):
-            self._sent_texts.clear()
-        if hasattr(self, "_last_buffer_text"):
-            self._last_buffer_text = ""
-        if hasattr(self, "_last_buffer_content"):
-            self._last_buffer_content = ""
-        if hasattr(self, "_last_meaningful_transcription_time"):
-            self._last_meaningful_transcription_time = None
+        self._send_coalescer.close()
+        self._sent_hashes.clear()
+        self._last_message = None
+        self._last_buffer_text = ""
+        self._last_buffer_content = ""
+        self._last_meaningful_transcription_time = None
 
     def _on_open(self, ws) -> None:
-        """WebSocket open event handler"""
+        """WebSocket open event handler, also called on each reconnect"""
         logger.info("WebSocket connection opened")
+        self._reconnect_attempts = 0
         self.is_connected = True
+        self._send_coalescer.start()
 
     def _on_message(self, ws, message) -> None:
         """WebSocket message event handler"""
-        try:
-            # Parse JSON message
-            data = json.loads(message)
-            logger.info(f"Received WebSocket message: {data}")
+        # An identical frame carries nothing new, so skip it before parsing
+        if message == self._last_message:
+            return
+        self._last_message = message
 
-            # WhisperLiveKit actual message format
-            msg_type = data.get("type", "")
-            status = data.get("status", "")
+        try:
+            # Parse JSON message (orjson accepts str and bytes frames alike)
+            data = orjson.loads(message)
+
+            # Per-frame logging is checked once so f-strings are only
+            # formatted when debug output is enabled
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"Received WebSocket message: {data}")
+
+            # Control messages are handled without touching the text state
+            handler = self._MESSAGE_HANDLERS.get(data.get("type"))
+            if handler is not None:
+                getattr(self, handler)(data)
+                return
 
-            # Handle different message types
-            if msg_type == "ready_to_stop":
-                logger.info("Server ready to stop - processing complete")
+            # Status-only frames carry no text to process
+            buffer_text = data.get("buffer_transcription")
+            lines = data.get("lines")
+            if not buffer_text and not lines:
+                if data.get("status") == "no_audio_detected":
+                    logger.debug("No audio detected by server")
                 return
 
-            # Keep track of previously sent text to avoid duplicates
-            if not hasattr(self, "_sent_texts"):
-                self._sent_texts = set()
-            if not hasattr(self, "_last_buffer_text"):
-                self._last_buffer_text = ""
-            if not hasattr(self, "_last_meaningful_transcription_time"):
-                self._last_meaningful_transcription_time = None
-            if not hasattr(self, "_silence_timeout_seconds"):
-                self._silence_timeout_seconds = 3.0
-            if not hasattr(self, "_last_buffer_content"):
-                self._last_buffer_content = ""
-
-            # Check for transcription in buffer_transcription
-            buffer_text = data.get("buffer_transcription", "").strip()
+            buffer_text = buffer_text.strip() if buffer_text else ""
             current_time = time.time()
 
             # Check for silence timeout - clear buffer if we've been silent too long
@@ -330,7 +774,7 @@ class TranscriptionService:
                 time_since_last = (
                     current_time - self._last_meaningful_transcription_time
                 )
-                if time_since_last > self._silence_timeout_seconds:
+                if time_since_last > self.SILENCE_TIMEOUT_SECONDS:
                     logger.debug(
                         f"Silence detected for {time_since_last:.1f}s, clearing buffer tracking"
                     )
@@ -339,7 +783,8 @@ class TranscriptionService:
                     self._last_meaningful_transcription_time = None
 
             if buffer_text:
-                logger.info(f"Buffer transcription: {buffer_text}")
+                if debug:
+                    logger.debug(f"Buffer transcription: {buffer_text}")
 
                 # Check if this is just a repetition of the same content
                 if buffer_text == self._last_buffer_content:
@@ -347,13 +792,12 @@ class TranscriptionService:
                     return
 
                 # Only send the new part of the buffer
-                if buffer_text.startswith(self._last_buffer_text) and len(
-                    buffer_text
-                ) > len(self._last_buffer_text):
-                    # Extract only the new text (don't strip to preserve spaces between words)
-                    new_text = buffer_text[len(self._last_buffer_text) :]
+                new_text = self._new_buffer_suffix(buffer_text)
+                if new_text is not None:
+                    # Don't strip to preserve spaces between words
                     if new_text.strip():  # Only check if non-empty after stripping
-                        logger.info(f"New buffer text: {new_text}")
+                        if debug:
+                            logger.debug(f"New buffer text: {new_text}")
                         self.handle_transcription(new_text, False)
                         self._last_meaningful_transcription_time = current_time
                 elif buffer_text != self._last_buffer_text:
@@ -365,44 +809,94 @@ class TranscriptionService:
                 self._last_buffer_content = buffer_text
 
             # Check for transcription in lines array
-            lines = data.get("lines", [])
-
-            for line in lines:
+            for line in lines or ():
                 if isinstance(line, dict):
                     # Line might have text field
                     line_text = line.get("text", "").strip()
-                    if line_text and line_text not in self._sent_texts:
-                        logger.info(f"Line transcription: {line_text}")
+                    if line_text and self._remember_sent(line_text):
+                        if debug:
+                            logger.debug(f"Line transcription: {line_text}")
                         self.handle_transcription(line_text, True)
-                        self._sent_texts.add(line_text)
                         self._last_meaningful_transcription_time = time.time()
                 elif isinstance(line, str) and line.strip():
                     # Line might be just a string
                     line_text = line.strip()
-                    if line_text not in self._sent_texts:
-                        logger.info(f"Line transcription (str): {line_text}")
+                    if self._remember_sent(line_text):
+                        if debug:
+                            logger.debug(f"Line transcription (str): {line_text}")
                         self.handle_transcription(line_text, True)
-                        self._sent_texts.add(line_text)
                         self._last_meaningful_transcription_time = time.time()
 
             # Check if audio is being detected
-            if status == "no_audio_detected":
+            if data.get("status") == "no_audio_detected":
                 logger.debug("No audio detected by server")
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON message: {message}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def _handle_ready_to_stop(self, data: Dict[str, Any]) -> None:
+        """Handle the server's acknowledgement of the stop signal
+
+        Args:
+            data: Parsed message
+        """
+        logger.info("Server ready to stop - processing complete")
+        self._stop_acked.set()
+
+    def _new_buffer_suffix(self, buffer_text: str) -> Optional[str]:
+        """Get the text appended to the buffer since the last message
+
+        Only the last BUFFER_ANCHOR_CHARS characters of the previous buffer
+        are compared, so the check does not grow with the buffer length.
+
+        Args:
+            buffer_text: Current buffer transcription
+
+        Returns:
+            The new suffix, or None if the buffer does not extend the last one
+        """
+        last = self._last_buffer_text
+        last_len = len(last)
+        if len(buffer_text) <= last_len:
+            return None
+
+        anchor_start = max(0, last_len - self.BUFFER_ANCHOR_CHARS)
+        if not buffer_text.startswith(last[anchor_start:], anchor_start):
+            return None
+        return buffer_text[last_len:]
+
+    def _remember_sent(self, text: str) -> bool:
+        """Record a final line in the bounded sent-text history
+
+        Args:
+            text: Final line text
+
+        Returns:
+            True if the line was not sent recently, False if it is a duplicate
+        """
+        text_hash = hash(text)
+        sent = self._sent_hashes
+        if text_hash in sent:
+            return False
+
+        sent[text_hash] = None
+        if len(sent) > self.SENT_TEXT_HISTORY:
+            sent.popitem(last=False)
+        return True
+
     def _on_error(self, ws, error) -> None:
         """WebSocket error event handler"""
         logger.error(f"WebSocket error: {error}")
         self.is_connected = False
+        self._stop_acked.set()
 
     def _on_close(self, ws, close_status_code, close_msg) -> None:
         """WebSocket close event handler"""
         logger.info(f"WebSocket closed: {close_status_code} - {close_msg}")
         self.is_connected = False
+        self._stop_acked.set()
 
     def is_server_running(self) -> bool:
         """Check if server process is running
@@ -428,12 +922,24 @@ class TranscriptionService:
             "is_connected": self.is_connected,
         }
 
-    def restart_server(self) -> bool:
+    def restart_server(self, server_config: Optional[ServerConfig] = None) -> bool:
         """Restart the server
 
+        Args:
+            server_config: New server configuration, None to restart with the
+                current one. A running server is left untouched if the new
+                configuration is unchanged.
+
         Returns:
             True if server restarted successfully
         """
+        if server_config is not None:
+            if server_config == self.server_config and self.is_server_running():
+                logger.info("Server configuration unchanged, skipping restart")
+                return True
+            self.server_config = server_config
+            self.rebuild_cmd()
+
         self.stop_server()
         time.sleep(0.5)  # Brief pause before restart
         return self.start_server()